@@ -26,14 +26,61 @@ Requirements:
 import os
 import sys
 import argparse
+import heapq
 import json
 from pathlib import Path
-from resume_job_matcher import ResumeJobMatcher
+from resume_job_matcher import (ResumeJobMatcher, AssessmentRecord, MissingAPIKeyError, DEFAULT_CACHE_DIR, BATCH_RESULTS_FILENAME,
+                                 BATCH_PARQUET_FILENAME, iter_batch_results, top_parquet_results)
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
 
-def create_sample_job_profile():
-    """Create a sample job profile for testing purposes."""
-    job_profile_content = """
+
+def _json_default(obj):
+    """Serialize AssessmentRecord values for the standard library json module."""
+    if isinstance(obj, AssessmentRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(output_path, data) -> None:
+    """
+    Write data as indented UTF-8 JSON in a single write, using orjson when it is installed.
+    
+    ``data`` may contain AssessmentRecord dataclasses; orjson serializes them natively.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    Path(output_path).write_bytes(payload)
+
+
+def load_endpoints(path: str) -> list:
+    """
+    Read additional OpenAI-compatible API endpoints from a JSON file.
+    
+    The file holds a list of objects with an "api_key" and an optional "base_url",
+    which keeps the keys out of the command line and shell history.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [(endpoint['api_key'], endpoint.get('base_url')) for endpoint in json.load(f)]
+
+
+def iter_pdfs(directory: str):
+    """Lazily yield PDF file paths in a directory using a single scandir pass."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(".pdf"):
+                yield entry.path
+
+
+SAMPLE_JOB_PROFILE_PATH = "sample_job_profile.txt"
+
+# Sample content is pre-encoded once at import so writing it is a single os.write
+_SAMPLE_JOB_PROFILE = """
 Software Engineer - Full Stack Developer
 
 Job Description:
@@ -81,18 +128,9 @@ We value innovation, collaboration, and continuous learning. Our team is passion
 Employment Type: Full-time
 Location: San Francisco, CA (Hybrid work options available)
 Salary Range: $120,000 - $160,000 annually
-"""
-    
-    with open("sample_job_profile.txt", "w", encoding="utf-8") as f:
-        f.write(job_profile_content)
-    
-    print("✅ Created sample_job_profile.txt")
-    return "sample_job_profile.txt"
+""".encode("utf-8")
 
-
-def create_sample_resume_content():
-    """Create sample resume content for testing (would normally be a PDF)."""
-    resume_content = """
+_SAMPLE_RESUME_CONTENT = """
 JOHN DOE
 Software Engineer
 Email: john.doe@email.com | Phone: (555) 123-4567
@@ -165,22 +203,46 @@ ACHIEVEMENTS
 • Contributed to open-source projects with 500+ GitHub stars
 • Spoke at local tech meetup about "Modern React Patterns" (2022)
 """
+
+
+def create_sample_job_profile():
+    """Create a sample job profile for testing purposes."""
+    fd = os.open(SAMPLE_JOB_PROFILE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _SAMPLE_JOB_PROFILE)
+    finally:
+        os.close(fd)
     
+    print(f"✅ Created {SAMPLE_JOB_PROFILE_PATH}")
+    return SAMPLE_JOB_PROFILE_PATH
+
+
+def create_sample_resume_content():
+    """Create sample resume content for testing (would normally be a PDF)."""
     # Note: In a real scenario, this would be a PDF file
     print("ℹ️  Sample resume content created (this would normally be a PDF file)")
     print("📝 For a complete demo, you would need an actual PDF resume file")
-    return resume_content
+    return _SAMPLE_RESUME_CONTENT
 
 
-def assess_single_resume(resume_path: str, job_profile_path: str, output_dir: str = "."):
+def assess_single_resume(resume_path: str, job_profile_path: str, output_dir: str = ".", cache_dir: str = None,
+                         max_input_tokens: int = None, screening_model: str = None,
+                         requests_per_minute: float = None, tokens_per_minute: float = None,
+                         service_tier: str = None):
     """Assess a single resume against a job profile."""
+    resume_file = Path(resume_path)
+    out_dir = Path(output_dir)
     try:
-        print(f"🔍 Assessing resume: {Path(resume_path).name}")
+        print(f"🔍 Assessing resume: {resume_file.name}")
         print(f"📋 Job profile: {Path(job_profile_path).name}")
         print("-" * 50)
         
         # Initialize the matcher
-        matcher = ResumeJobMatcher()
+        matcher = ResumeJobMatcher(cache_dir=cache_dir, max_input_tokens=max_input_tokens,
+                                   screening_model=screening_model,
+                                   requests_per_minute=requests_per_minute,
+                                   tokens_per_minute=tokens_per_minute,
+                                   service_tier=service_tier)
         
         # Perform assessment
         result = matcher.assess_resume_job_fit(resume_path, job_profile_path)
@@ -207,22 +269,13 @@ def assess_single_resume(resume_path: str, job_profile_path: str, output_dir: st
                 print(f"\n🎯 Recommendation: {proceed}")
             
             # Save detailed report
-            output_path = Path(output_dir) / f"{Path(resume_path).stem}_assessment_report.txt"
+            output_path = out_dir / f"{resume_file.stem}_assessment_report.txt"
             if matcher.save_assessment_report(result, str(output_path)):
                 print(f"\n💾 Detailed report saved to: {output_path}")
             
             # Save JSON results
-            json_path = Path(output_dir) / f"{Path(resume_path).stem}_assessment_results.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                # Create a JSON-serializable version
-                json_result = {
-                    'success': result['success'],
-                    'resume_path': result['resume_path'],
-                    'job_profile_path': result['job_profile_path'],
-                    'llm_assessment': result['llm_assessment'],
-                    'resume_metadata': result['resume_parsing_result']['metadata'] if result['resume_parsing_result'] else None
-                }
-                json.dump(json_result, f, indent=2, ensure_ascii=False)
+            json_path = out_dir / f"{resume_file.stem}_assessment_results.json"
+            write_json(json_path, AssessmentRecord.from_result(result))
             print(f"📄 JSON results saved to: {json_path}")
             
         else:
@@ -233,25 +286,64 @@ def assess_single_resume(resume_path: str, job_profile_path: str, output_dir: st
         
     except Exception as e:
         print(f"❌ Error during assessment: {str(e)}")
-        if "OPENAI_API_KEY" in str(e):
-            print("\n💡 Tip: Make sure to set your OpenAI API key:")
-            print("   export OPENAI_API_KEY='your-api-key-here'")
         return False
 
 
-def batch_assess_resumes(job_profile_path: str, resume_dir: str, output_dir: str = "assessments"):
-    """Assess multiple resumes in a directory against a job profile."""
+def batch_assess_resumes(job_profile_path: str, resume_dir: str, output_dir: str = "assessments",
+                         max_concurrency: int = 10, batch_mode: bool = False, cache_dir: str = None,
+                         pdfs: list = None, timeout: float = None, parse_workers: int = None,
+                         parquet: bool = False, max_input_tokens: int = None, resumes_per_prompt: int = 1,
+                         screening_model: str = None, requests_per_minute: float = None,
+                         tokens_per_minute: float = None, endpoints_file: str = None,
+                         embedding_threshold: float = None, service_tier: str = None):
+    """
+    Assess multiple resumes in a directory against a job profile.
+    
+    Assessments run concurrently against the realtime API, or are submitted as a single
+    OpenAI Batch API job (cheaper, but may take up to 24 hours) when ``batch_mode`` is set.
+    ``pdfs`` may carry the files already found by validate_files to avoid rescanning resume_dir.
+    With ``parquet`` set, results go to a single results.parquet file instead of one report per resume.
+    ``endpoints_file`` lists extra API endpoints (see load_endpoints) to spread realtime requests over.
+    With ``embedding_threshold`` set, realtime batches skip the LLM for resumes whose embedding
+    similarity to the job profile is below it.
+    """
+    out_dir = Path(output_dir)
     try:
         print(f"📂 Batch assessing resumes in: {resume_dir}")
         print(f"📋 Job profile: {Path(job_profile_path).name}")
         print(f"📁 Output directory: {output_dir}")
+        if batch_mode:
+            print("🕒 Batch mode: submitting to the OpenAI Batch API (results may take up to 24h)")
+        else:
+            print(f"⚡ Max concurrent assessments: {max_concurrency}")
         print("-" * 50)
         
         # Initialize the matcher
-        matcher = ResumeJobMatcher()
+        matcher = ResumeJobMatcher(cache_dir=cache_dir, max_input_tokens=max_input_tokens,
+                                   screening_model=screening_model,
+                                   requests_per_minute=requests_per_minute,
+                                   tokens_per_minute=tokens_per_minute,
+                                   endpoints=load_endpoints(endpoints_file) if endpoints_file else None,
+                                   embedding_threshold=embedding_threshold,
+                                   service_tier=service_tier)
         
         # Perform batch assessment
-        results = matcher.batch_assess_resumes(job_profile_path, resume_dir, output_dir)
+        if pdfs is None:
+            pdfs = iter_pdfs(resume_dir)
+        
+        if batch_mode:
+            results = matcher.batch_assess_resumes_offline(job_profile_path, resume_dir, output_dir,
+                                                           pdf_files=pdfs,
+                                                           parquet=parquet,
+                                                           parse_workers=parse_workers)
+        else:
+            results = matcher.batch_assess_resumes(job_profile_path, resume_dir, output_dir,
+                                                   max_concurrency=max_concurrency,
+                                                   pdf_files=pdfs,
+                                                   task_timeout=timeout,
+                                                   parse_workers=parse_workers,
+                                                   parquet=parquet,
+                                                   resumes_per_prompt=resumes_per_prompt)
         
         if not results:
             print("❌ No PDF files found in the specified directory")
@@ -265,27 +357,45 @@ def batch_assess_resumes(job_profile_path: str, resume_dir: str, output_dir: str
         print(f"   Total files processed: {len(results)}")
         print(f"   Successful assessments: {len(successful)}")
         print(f"   Failed assessments: {len(failed)}")
+        filtered = [r for r in successful if 'embedding_similarity' in (r.get('llm_assessment') or {})]
+        if filtered:
+            print(f"   Filtered out by embedding similarity: {len(filtered)}")
         
-        if successful:
-            # Show top candidates
-            scored_results = [r for r in successful if r.get('llm_assessment', {}).get('overall_score') is not None]
-            if scored_results:
-                scored_results.sort(key=lambda x: x['llm_assessment']['overall_score'], reverse=True)
-                
+        if successful and parquet:
+            # The Parquet file holds only this run's results, so the ranking is a single columnar top-k
+            top_rows = top_parquet_results(out_dir / BATCH_PARQUET_FILENAME, k=5)
+            if top_rows:
                 print(f"\n🏆 Top Candidates:")
-                for i, result in enumerate(scored_results[:5], 1):
+                for i, row in enumerate(top_rows, 1):
+                    print(f"   {i}. {row['filename']:<30} Score: {row['score']:g}/10")
+        
+        elif successful:
+            # Show top candidates, streamed from the batch results file rather than the in-memory list.
+            # heapq.nlargest is stable like sorted(), so ties keep their original order.
+            scored_records = (
+                r for r in iter_batch_results(out_dir / BATCH_RESULTS_FILENAME)
+                if r['success'] and r['job_profile_path'] == job_profile_path
+                and (r.get('llm_assessment') or {}).get('overall_score') is not None
+            )
+            top_results = heapq.nlargest(5, scored_records, key=lambda x: x['llm_assessment']['overall_score'])
+            if top_results:
+                print(f"\n🏆 Top Candidates:")
+                for i, result in enumerate(top_results, 1):
                     score = result['llm_assessment']['overall_score']
-                    name = Path(result['resume_path']).name
+                    name = os.path.basename(result['resume_path'])
                     print(f"   {i}. {name:<30} Score: {score}/10")
         
         if failed:
             print(f"\n❌ Failed Assessments:")
             for result in failed:
-                name = Path(result['resume_path']).name
+                name = os.path.basename(result['resume_path'])
                 error = result.get('error', 'Unknown error')
                 print(f"   - {name}: {error}")
         
-        print(f"\n💾 All reports saved to: {output_dir}/")
+        if parquet:
+            print(f"\n💾 All results saved to: {out_dir / BATCH_PARQUET_FILENAME}")
+        else:
+            print(f"\n💾 All reports saved to: {output_dir}/")
         print(f"📄 Batch summary: {output_dir}/batch_assessment_summary.txt")
         
         return True
@@ -296,32 +406,40 @@ def batch_assess_resumes(job_profile_path: str, resume_dir: str, output_dir: str
 
 
 def validate_files(resume_path: str = None, job_profile_path: str = None, resume_dir: str = None):
-    """Validate that required files exist."""
+    """
+    Validate that required files exist.
+    
+    Returns a tuple of (errors, pdf_files), where pdf_files lists the PDFs found in
+    resume_dir so callers can reuse the scan instead of enumerating the directory again.
+    
+    Raises MissingAPIKeyError if neither OPENAI_API_KEY nor TOGETHER_API_KEY is set.
+    """
+    # Check for an API key up front so the assessment itself never has to diagnose it
+    if not os.getenv('OPENAI_API_KEY') and not os.getenv('TOGETHER_API_KEY'):
+        raise MissingAPIKeyError("OPENAI_API_KEY or TOGETHER_API_KEY environment variable must be set")
+    
     errors = []
+    pdf_files = []
     
-    if resume_path and not Path(resume_path).exists():
+    if resume_path and not os.path.exists(resume_path):
         errors.append(f"Resume file not found: {resume_path}")
     
-    if job_profile_path and not Path(job_profile_path).exists():
+    if job_profile_path and not os.path.exists(job_profile_path):
         errors.append(f"Job profile file not found: {job_profile_path}")
     
-    if resume_dir and not Path(resume_dir).exists():
-        errors.append(f"Resume directory not found: {resume_dir}")
-    
-    if resume_dir and Path(resume_dir).exists():
-        pdf_files = list(Path(resume_dir).glob("*.pdf")) + list(Path(resume_dir).glob("*.PDF"))
-        if not pdf_files:
-            errors.append(f"No PDF files found in directory: {resume_dir}")
-    
-    # Check for OpenAI API key
-    if not os.getenv('OPENAI_API_KEY') and not os.getenv('TOGETHER_API_KEY'):
-        errors.append("OPENAI_API_KEY or TOGETHER_API_KEY environment variable must be set")
+    if resume_dir:
+        if not os.path.isdir(resume_dir):
+            errors.append(f"Resume directory not found: {resume_dir}")
+        else:
+            pdf_files = list(iter_pdfs(resume_dir))
+            if not pdf_files:
+                errors.append(f"No PDF files found in directory: {resume_dir}")
     
-    return errors
+    return errors, pdf_files
 
 
-def main():
-    """Main function for the assessment example."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the assessment example."""
     parser = argparse.ArgumentParser(
         description='Assess how well resumes match job profile descriptions using an LLM',
         epilog='''Examples:
@@ -357,13 +475,130 @@ def main():
         help='Output directory for reports (default: current directory)'
     )
     
+    parser.add_argument(
+        '--max-concurrency', '-c',
+        type=int,
+        default=10,
+        help='Maximum number of resumes assessed concurrently in batch mode (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--max-input-tokens',
+        type=int,
+        default=None,
+        help='Truncate each resume to this many tokens before sending it to the LLM, e.g. 2500 (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--screening-model',
+        type=str,
+        default=None,
+        help='Cheaper OpenAI model that assesses each resume first, e.g. gpt-4o-mini; '
+             'only borderline scores are re-assessed with GPT-4o (default: GPT-4o only)'
+    )
+    
+    parser.add_argument(
+        '--service-tier',
+        type=str,
+        choices=['auto', 'default', 'flex', 'priority'],
+        default=None,
+        help='OpenAI service tier for realtime requests, e.g. flex for cheaper, slower processing on models '
+             'that offer it; flex falls back to the default tier when out of capacity (default: project default)'
+    )
+    
+    parser.add_argument(
+        '--requests-per-minute',
+        type=float,
+        default=None,
+        help='Throttle LLM requests to this many per minute, e.g. your API tier\'s RPM limit (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--tokens-per-minute',
+        type=float,
+        default=None,
+        help='Throttle estimated LLM tokens (prompt plus max_tokens) to this many per minute, '
+             'e.g. your API tier\'s TPM limit (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--embedding-threshold',
+        type=float,
+        default=None,
+        help='Skip the LLM in batch mode for resumes whose text-embedding-3-small similarity to the job profile '
+             'is below this value, e.g. 0.3; calibrate it on a sample first (default: assess every resume)'
+    )
+    
+    parser.add_argument(
+        '--endpoints',
+        type=str,
+        default=None,
+        help='JSON file listing extra OpenAI-compatible endpoints ([{"api_key": ..., "base_url": ...}]) '
+             'to spread batch requests over, each within the per-minute limits above'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Seconds after which a single batch assessment is abandoned and recorded as failed (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=None,
+        help='Number of processes parsing PDFs in batch mode (default: CPU count, 0 to parse in-process)'
+    )
+    
+    parser.add_argument(
+        '--resumes-per-prompt',
+        type=int,
+        default=1,
+        help='Assess up to this many resumes in a single GPT-4o request in batch mode, e.g. 5 (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch-mode',
+        action='store_true',
+        help='Submit batch assessments through the OpenAI Batch API at ~50%% lower cost (completes within 24h, requires OPENAI_API_KEY)'
+    )
+    
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Write batch results to a single results.parquet file instead of one report per resume (requires pyarrow)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help=f'Directory for cached assessments of previously seen resume/job profile pairs (default: {DEFAULT_CACHE_DIR})'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query the LLM, ignoring and not updating the assessment cache'
+    )
+    
     parser.add_argument(
         '--create-samples',
         action='store_true',
         help='Create sample job profile and resume content for testing'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import so main() can be called repeatedly (e.g. when embedded in a server)
+_PARSER = _build_parser()
+
+
+def main(argv=None):
+    """Main function for the assessment example."""
+    args = _PARSER.parse_args(argv)
     
     # Handle sample creation
     if args.create_samples:
@@ -395,21 +630,22 @@ def main():
         return 1
     
     # Validate files
-    validation_errors = validate_files(
-        resume_path=args.resume,
-        job_profile_path=args.job_profile,
-        resume_dir=args.resume_dir
-    )
+    try:
+        validation_errors, pdf_files = validate_files(
+            resume_path=args.resume,
+            job_profile_path=args.job_profile,
+            resume_dir=args.resume_dir
+        )
+    except MissingAPIKeyError as e:
+        print(f"❌ {e}")
+        print(f"\n💡 To set your OpenAI API key:")
+        print(f"   export OPENAI_API_KEY='your-api-key-here'")
+        return 1
     
     if validation_errors:
         print("❌ Validation errors:")
         for error in validation_errors:
             print(f"   - {error}")
-        
-        if "OPENAI_API_KEY" in str(validation_errors):
-            print(f"\n💡 To set your OpenAI API key:")
-            print(f"   export OPENAI_API_KEY='your-api-key-here'")
-        
         return 1
     
     # Create output directory
@@ -417,14 +653,35 @@ def main():
     
     # Perform assessment
     success = False
+    cache_dir = None if args.no_cache else args.cache_dir
     
     if args.resume:
         # Single resume assessment
-        success = assess_single_resume(args.resume, args.job_profile, args.output_dir)
+        success = assess_single_resume(args.resume, args.job_profile, args.output_dir, cache_dir=cache_dir,
+                                       max_input_tokens=args.max_input_tokens,
+                                       screening_model=args.screening_model,
+                                       requests_per_minute=args.requests_per_minute,
+                                       tokens_per_minute=args.tokens_per_minute,
+                                       service_tier=args.service_tier)
     
     elif args.resume_dir:
         # Batch assessment
-        success = batch_assess_resumes(args.job_profile, args.resume_dir, args.output_dir)
+        success = batch_assess_resumes(args.job_profile, args.resume_dir, args.output_dir,
+                                       max_concurrency=args.max_concurrency,
+                                       batch_mode=args.batch_mode,
+                                       cache_dir=cache_dir,
+                                       pdfs=pdf_files,
+                                       timeout=args.timeout,
+                                       parse_workers=args.parse_workers,
+                                       parquet=args.parquet,
+                                       max_input_tokens=args.max_input_tokens,
+                                       resumes_per_prompt=args.resumes_per_prompt,
+                                       screening_model=args.screening_model,
+                                       requests_per_minute=args.requests_per_minute,
+                                       tokens_per_minute=args.tokens_per_minute,
+                                       endpoints_file=args.endpoints,
+                                       embedding_threshold=args.embedding_threshold,
+                                       service_tier=args.service_tier)
     
     if success:
         print(f"\n🎉 Assessment completed successfully!")
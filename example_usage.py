@@ -4,51 +4,172 @@ Example usage of the Resume PDF Parser
 """
 
 import sys
-import json
 import argparse
 import os
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from resume_parser import ResumeParser
+from typing import NamedTuple
 
+# resume_parser (and the PDF libraries behind it) is imported on first use, so
+# --help and argument errors return without loading it.
 
-def find_pdf_files(path: str) -> list:
-    """Find all PDF files in a given path (file or directory)."""
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+try:
+    from tqdm import tqdm  # Optional: single-line progress bar for batch parsing
+except ImportError:
+    tqdm = None
+
+
+# File extensions (lowercase) treated as PDFs
+_PDF_SUFFIXES = frozenset({'.pdf'})
+# The same suffixes as a tuple for str.endswith, which avoids splitting each name
+_PDF_SUFFIX_TUPLE = tuple(_PDF_SUFFIXES)
+
+# Below this many files, starting worker processes costs more than it saves
+MIN_FILES_FOR_POOL = 4
+
+# Threads writing JSON exports while parsing continues
+EXPORT_WORKERS = 4
+
+# Table fields included in JSON exports (the pandas DataFrame is not serializable)
+_JSON_TABLE_KEYS = ('page', 'table_number', 'raw_table', 'text_representation')
+
+
+class PdfFile(NamedTuple):
+    """
+    A PDF path with its file name and stem, split once when the file is found.
+    
+    ``subdir`` is the file's directory relative to the searched directory ('' at its top level),
+    so exports of same-named files from different subfolders do not overwrite each other.
+    """
+    path: str
+    stem: str
+    name: str
+    subdir: str = ''
+    
+    @classmethod
+    def from_path(cls, path, root=None) -> "PdfFile":
+        """
+        Build a PdfFile from a path string (or return it unchanged if it already is one).
+        
+        With ``root``, the directory searched for the file, ``subdir`` is set relative to it.
+        """
+        if isinstance(path, cls):
+            return path
+        path = str(path)
+        directory, name = os.path.split(path)
+        return cls(path, os.path.splitext(name)[0], name, _relative_dir(directory, root) if root else '')
+
+
+def _relative_dir(directory: str, root: str) -> str:
+    """Return ``directory`` relative to ``root``, or '' for ``root`` itself."""
+    relative = os.path.relpath(directory, root)
+    return '' if relative == os.curdir else relative
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Return the process-wide ResumeParser, importing and creating it on first use."""
+    from resume_parser import ResumeParser
+    return ResumeParser()
+
+
+def _release_pdf_store():
+    """
+    Empty MuPDF's resource store after a file has been parsed.
+    
+    MuPDF keeps one context (and store) per process, shared across documents; the fonts
+    and images it holds belong to the closed document, so emptying it bounds memory on
+    long batches without losing anything the next file could reuse.
+    """
+    # resume_parser imports fitz lazily; if no file was opened there is no store to empty
+    fitz = sys.modules.get('fitz')
+    if fitz is None:
+        return
+    fitz.TOOLS.store_shrink(100)
+
+
+def _parse_one(pdf_path: str) -> dict:
+    """Parse a resume in a pool worker, reusing the worker process's ResumeParser."""
+    result = _get_parser().parse_resume(pdf_path)
+    _release_pdf_store()
+    return result
+
+
+def write_json(output_path, data) -> None:
+    """Write data as indented UTF-8 JSON in a single write, using orjson when it is installed."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        import json
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    Path(output_path).write_bytes(payload)
+
+
+def iter_pdf_files(path: str, recursive: bool = False):
+    """
+    Lazily yield the PDF files in a given path (file or directory) as PdfFile tuples, in directory order.
+    
+    Paths are produced while the directory is still being scanned, so callers can
+    start parsing before a large directory has been fully listed. With ``recursive``,
+    subdirectories are searched too (symlinked directories are not followed).
+    """
     path_obj = Path(path)
     
     if path_obj.is_file():
-        if path_obj.suffix.lower() == '.pdf':
-            return [str(path_obj)]
+        if path_obj.suffix.lower() in _PDF_SUFFIXES:
+            yield PdfFile(str(path_obj), path_obj.stem, path_obj.name)
         else:
             print(f"❌ File {path} is not a PDF file")
-            return []
     
     elif path_obj.is_dir():
-        pdf_files = []
-        for file_path in path_obj.glob('*.pdf'):
-            pdf_files.append(str(file_path))
-        
-        # Also check for uppercase PDF extension
-        for file_path in path_obj.glob('*.PDF'):
-            pdf_files.append(str(file_path))
-        
-        if not pdf_files:
-            print(f"❌ No PDF files found in directory: {path}")
+        found = False
+        if recursive:
+            # os.walk is built on os.scandir, so this is one pass per directory
+            for root, _dirs, files in os.walk(path, followlinks=False):
+                subdir = _relative_dir(root, path)
+                for name in files:
+                    if name.lower().endswith(_PDF_SUFFIX_TUPLE):
+                        found = True
+                        yield PdfFile(os.path.join(root, name), os.path.splitext(name)[0], name, subdir)
         else:
-            print(f"📁 Found {len(pdf_files)} PDF file(s) in directory: {path}")
+            # One case-insensitive directory pass; DirEntry.is_file() reuses the readdir result
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(_PDF_SUFFIX_TUPLE) and entry.is_file():
+                        found = True
+                        yield PdfFile(entry.path, os.path.splitext(entry.name)[0], entry.name)
         
-        return sorted(pdf_files)
+        if not found:
+            print(f"❌ No PDF files found in directory: {path}")
     
     else:
         print(f"❌ Path does not exist: {path}")
-        return []
 
 
-def parse_single_resume(pdf_path: str):
-    """Parse a single resume and display results."""
+def find_pdf_files(path: str, recursive: bool = False) -> list:
+    """Find all PDF files in a given path (file or directory), as PdfFile tuples sorted by path."""
+    pdf_files = sorted(iter_pdf_files(path, recursive=recursive))
+    if len(pdf_files) > 1:
+        print(f"📁 Found {len(pdf_files)} PDF file(s) in: {path}")
+    return pdf_files
+
+
+def parse_single_resume(pdf_path, show_sample: bool = True):
+    """Parse a single resume and display results, including a text sample if ``show_sample`` is set."""
+    pdf_file = PdfFile.from_path(pdf_path)
+    pdf_path = pdf_file.path
     print(f"Parsing resume: {pdf_path}")
     print("=" * 50)
     
-    parser = ResumeParser()
+    parser = _get_parser()
     result = parser.parse_resume(pdf_path)
     
     if result['success']:
@@ -73,16 +194,17 @@ def parse_single_resume(pdf_path: str):
                       f"Size: {len(table['raw_table'])}x{len(table['raw_table'][0]) if table['raw_table'] else 0}")
         
         # Save to file
-        output_file = f"{Path(pdf_path).stem}_parsed.txt"
+        output_file = f"{pdf_file.stem}_parsed.txt"
         if parser.save_results_to_file(result, output_file):
             print(f"💾 Results saved to: {output_file}")
         
-        # Display sample text
-        combined_text = parser.get_combined_text(result)
+        # Display sample text, joining only the first chunks (one extra character shows if there is more)
+        combined_text = parser.get_combined_text(result, max_chars=301) if show_sample else ""
         if combined_text:
             print(f"\n📖 Sample text (first 300 characters):")
             print("-" * 40)
-            print(combined_text[:300] + "..." if len(combined_text) > 300 else combined_text)
+            head = combined_text[:300]
+            print(head + ("..." if len(combined_text) > 300 else ""))
     
     else:
         print(f"❌ Parsing failed: {result.get('error', 'Unknown error')}")
@@ -91,67 +213,164 @@ def parse_single_resume(pdf_path: str):
     return result
 
 
-def parse_multiple_resumes(pdf_paths: list):
-    """Parse multiple resumes and provide summary statistics."""
-    print(f"Parsing {len(pdf_paths)} resumes...")
+def _iter_parse_results(pdf_paths):
+    """
+    Yield (PdfFile, result) pairs in input order, using worker processes for larger batches.
+    
+    ``pdf_paths`` may be a lazy iterator of path strings or PdfFile tuples; files are
+    submitted for parsing as they are produced.
+    """
+    pdf_files = map(PdfFile.from_path, pdf_paths)
+    head = list(itertools.islice(pdf_files, MIN_FILES_FOR_POOL))
+    if len(head) < MIN_FILES_FOR_POOL:
+        for pdf_file in head:
+            yield pdf_file, _parse_one(pdf_file.path)
+        return
+    
+    submitted = []
+    
+    def track(files):
+        for pdf_file in files:
+            submitted.append(pdf_file)
+            yield pdf_file.path
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # map() submits every path before returning, so `submitted` is complete here
+        results = executor.map(_parse_one, track(itertools.chain(head, pdf_files)), chunksize=4)
+        yield from zip(submitted, results)
+
+
+def parse_multiple_resumes(pdf_paths, json_dir: str = None, verbose: bool = False):
+    """
+    Parse multiple resumes in parallel and provide summary statistics.
+    
+    ``pdf_paths`` may be a list or a lazy iterator such as iter_pdf_files().
+    When ``json_dir`` is given, each result is exported to JSON there on a background
+    thread as soon as it is parsed, so writing overlaps the remaining parsing.
+    With tqdm installed, progress is a single bar and only failures get their own
+    lines unless ``verbose`` is set.
+    """
+    sized = isinstance(pdf_paths, (list, tuple))
+    count = f"{len(pdf_paths)} " if sized else ""
+    print(f"Parsing {count}resumes...")
     print("=" * 50)
     
-    parser = ResumeParser()
     results = []
+    # Summary counts, accumulated as results arrive instead of re-scanning them afterwards
+    n_success = total_chunks = total_tables = 0
+    export_pool = ThreadPoolExecutor(max_workers=EXPORT_WORKERS) if json_dir is not None else None
+    json_prefix = os.path.join(json_dir, '') if json_dir is not None else None
+    # (future, output path) of submitted exports, reported in order on this thread once done
+    pending_exports = deque()
+    progress = (tqdm(total=len(pdf_paths) if sized else None, unit='pdf', smoothing=0.1)
+                if tqdm is not None else None)
+    # Lines written through tqdm keep the bar intact below them
+    write = progress.write if progress is not None else print
     
-    for pdf_path in pdf_paths:
-        print(f"Processing: {Path(pdf_path).name}")
-        result = parser.parse_resume(pdf_path)
-        results.append(result)
-        
-        if result['success']:
-            print(f"  ✅ Success - {len(result['text_content'])} chunks, {len(result['tables'])} tables")
-        else:
-            print(f"  ❌ Failed - {result.get('error', 'Unknown error')}")
+    def report_exports(wait: bool = False):
+        # Export threads don't print, so their lines cannot interleave with the ones below
+        while pending_exports and (wait or pending_exports[0][0].done()):
+            future, output_path = pending_exports.popleft()
+            error = future.exception()
+            if error is not None:
+                write(f"❌ Error exporting to JSON ({output_path}): {str(error)}")
+            elif progress is None or verbose:
+                write(f"📄 JSON export saved to: {output_path}")
     
-    # Summary statistics
-    successful = [r for r in results if r['success']]
-    failed = [r for r in results if not r['success']]
+    try:
+        for pdf_file, result in _iter_parse_results(pdf_paths):
+            results.append(result)
+            n_chunks = n_tables = 0
+            if result['success']:
+                n_chunks = len(result['text_content'])
+                n_tables = len(result['tables'])
+                n_success += 1
+                total_chunks += n_chunks
+                total_tables += n_tables
+            
+            if export_pool is not None:
+                output_path = _json_export_path(json_prefix, pdf_file)
+                pending_exports.append((export_pool.submit(write_json_export, result, output_path), output_path))
+            
+            if progress is not None:
+                progress.update()
+            
+            if progress is None or verbose or not result['success']:
+                write(f"Processing: {pdf_file.name}")
+                if result['success']:
+                    write(f"  ✅ Success - {n_chunks} chunks, {n_tables} tables")
+                else:
+                    write(f"  ❌ Failed - {result.get('error', 'Unknown error')}")
+            
+            report_exports()
+    finally:
+        if progress is not None:
+            progress.close()
+        if export_pool is not None:
+            # Wait for the remaining exports before reporting
+            export_pool.shutdown(wait=True)
+            report_exports(wait=True)
     
+    # Summary statistics
     print(f"\n📊 Summary:")
     print(f"  Total files: {len(results)}")
-    print(f"  Successful: {len(successful)}")
-    print(f"  Failed: {len(failed)}")
+    print(f"  Successful: {n_success}")
+    print(f"  Failed: {len(results) - n_success}")
     
-    if successful:
-        total_chunks = sum(len(r['text_content']) for r in successful)
-        total_tables = sum(len(r['tables']) for r in successful)
+    if n_success:
         print(f"  Total text chunks: {total_chunks}")
         print(f"  Total tables: {total_tables}")
     
     return results
 
 
+def _json_export_path(output_prefix: str, pdf_file: PdfFile) -> str:
+    """
+    Return the JSON export path for a PDF, given the output directory prefix (ending in a separator).
+    
+    Files found in subdirectories are exported to the same subdirectories of the output
+    directory, which are created here (on the calling thread, before the export is queued).
+    """
+    if not pdf_file.subdir:
+        return f"{output_prefix}{pdf_file.stem}_parsed.json"
+    output_dir = os.path.join(output_prefix, pdf_file.subdir)
+    _make_export_dir(output_dir)
+    return os.path.join(output_dir, f"{pdf_file.stem}_parsed.json")
+
+
+@functools.lru_cache(maxsize=None)
+def _make_export_dir(output_dir: str) -> None:
+    """Create an export subdirectory, once per directory."""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+
+def write_json_export(parsing_result: dict, output_path: str) -> None:
+    """
+    Write parsing results to a JSON file, raising on failure.
+    
+    Export threads call this rather than export_to_json, leaving the printing to the main thread.
+    """
+    # Create a JSON-serializable version of the result
+    json_result = {
+        'success': parsing_result['success'],
+        'file_path': parsing_result['file_path'],
+        'error': parsing_result.get('error'),
+        'metadata': parsing_result.get('metadata', {}),
+        'text_content': parsing_result.get('text_content', []),
+        # Handle tables (exclude DataFrame objects)
+        'tables': [
+            {key: table[key] for key in _JSON_TABLE_KEYS}
+            for table in parsing_result.get('tables', [])
+        ]
+    }
+    
+    write_json(output_path, json_result)
+
+
 def export_to_json(parsing_result: dict, output_path: str):
     """Export parsing results to JSON format."""
     try:
-        # Create a JSON-serializable version of the result
-        json_result = {
-            'success': parsing_result['success'],
-            'file_path': parsing_result['file_path'],
-            'error': parsing_result.get('error'),
-            'metadata': parsing_result.get('metadata', {}),
-            'text_content': parsing_result.get('text_content', []),
-            'tables': []
-        }
-        
-        # Handle tables (exclude DataFrame objects)
-        for table in parsing_result.get('tables', []):
-            json_table = {
-                'page': table['page'],
-                'table_number': table['table_number'],
-                'raw_table': table['raw_table'],
-                'text_representation': table['text_representation']
-            }
-            json_result['tables'].append(json_table)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_result, f, indent=2, ensure_ascii=False)
+        write_json_export(parsing_result, output_path)
         
         print(f"📄 JSON export saved to: {output_path}")
         return True
@@ -161,8 +380,36 @@ def export_to_json(parsing_result: dict, output_path: str):
         return False
 
 
-def parse_args():
-    """Parse command line arguments."""
+def export_all_to_json(results: list, output_prefix: str, root: str = None) -> int:
+    """
+    Export many parsing results to JSON concurrently, returning how many were written.
+    
+    Serialization and disk writes for different files overlap on a small thread pool.
+    ``root`` is the directory the files were found in, whose subdirectories are mirrored
+    in the output directory (see _json_export_path).
+    """
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+        futures = {}
+        for result in results:
+            output_path = _json_export_path(output_prefix, PdfFile.from_path(result['file_path'], root))
+            futures[executor.submit(write_json_export, result, output_path)] = output_path
+        
+        # Outcomes are printed here as the exports finish, so lines from different threads don't interleave
+        exported = 0
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                print(f"❌ Error exporting to JSON ({futures[future]}): {str(error)}")
+            else:
+                print(f"📄 JSON export saved to: {futures[future]}")
+                exported += 1
+    
+    print(f"📄 Exported {exported}/{len(futures)} result(s) to JSON")
+    return exported
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description='Parse resume PDFs and extract structured information',
         epilog='''Examples:
@@ -170,6 +417,7 @@ def parse_args():
   %(prog)s --file /path/to/resume.pdf
   %(prog)s --file /path/to/resumes/folder/
   %(prog)s --file ./resumes/ --json
+  %(prog)s --file ./resumes/ --recursive
         ''',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -181,10 +429,23 @@ def parse_args():
         help='Path to a single PDF file or directory containing PDF files'
     )
     
+    parser.add_argument(
+        '--recursive', '-r',
+        action='store_true',
+        help='Also search subdirectories of a --file directory for PDF files'
+    )
+    
     parser.add_argument(
         '--json', '-j',
         action='store_true',
-        help='Automatically export results to JSON format without prompting'
+        help='Automatically export results to JSON format without prompting (the default when stdin is not a terminal)'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Print the first 300 characters of a single resume\'s text even when stdout is not a terminal '
+             '(the preview is shown by default on a terminal), and a line per parsed file in batch mode'
     )
     
     parser.add_argument(
@@ -194,44 +455,59 @@ def parse_args():
         help='Output directory for generated files (default: current directory)'
     )
     
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import so repeated calls don't rebuild it
+_PARSER = _build_parser()
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    return _PARSER.parse_args(argv)
+
+
+def main(argv=None):
     """Main function for example usage."""
-    args = parse_args()
+    args = parse_args(argv)
     
-    # Find PDF files
-    pdf_files = find_pdf_files(args.file)
+    # Find PDF files, peeking at the first two to choose between single and batch mode
+    pdf_iter = iter_pdf_files(args.file, recursive=args.recursive)
+    first_files = list(itertools.islice(pdf_iter, 2))
     
-    if not pdf_files:
+    if not first_files:
         print("❌ No valid PDF files found.")
         return 1
     
-    # Create output directory if it doesn't exist
-    output_dir = Path(args.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Create output directory if it doesn't exist (the current directory always does)
+    if args.output_dir != '.':
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    output_prefix = os.path.join(args.output_dir, '')
+    
+    # Without a terminal to answer the prompt (CI, pipelines), export instead of blocking on input()
+    export_json = args.json or not sys.stdin.isatty()
     
-    if len(pdf_files) == 1:
+    if len(first_files) == 1:
         # Parse single resume
-        print(f"📋 Processing single resume: {Path(pdf_files[0]).name}")
-        result = parse_single_resume(pdf_files[0])
+        print(f"📋 Processing single resume: {first_files[0].name}")
+        # The sample is only useful to someone watching the terminal
+        result = parse_single_resume(first_files[0], show_sample=args.verbose or sys.stdout.isatty())
         
         # Handle JSON export
-        if args.json or (not args.json and input("\nExport to JSON? (y/n): ").lower().strip() == 'y'):
-            json_file = output_dir / f"{Path(pdf_files[0]).stem}_parsed.json"
-            export_to_json(result, str(json_file))
+        if export_json or input("\nExport to JSON? (y/n): ").lower().strip() == 'y':
+            export_to_json(result, _json_export_path(output_prefix, first_files[0]))
     
     else:
-        # Parse multiple resumes
-        print(f"📋 Processing {len(pdf_files)} resumes from: {args.file}")
-        results = parse_multiple_resumes(pdf_files)
+        # Parse multiple resumes while the directory scan continues,
+        # exporting JSON while parsing when it was requested up front
+        print(f"📋 Processing resumes from: {args.file}")
+        results = parse_multiple_resumes(itertools.chain(first_files, pdf_iter),
+                                         json_dir=args.output_dir if export_json else None,
+                                         verbose=args.verbose)
         
         # Handle JSON export
-        if args.json or (not args.json and input("\nExport all results to JSON? (y/n): ").lower().strip() == 'y'):
-            for pdf_path, result in zip(pdf_files, results):
-                json_file = output_dir / f"{Path(pdf_path).stem}_parsed.json"
-                export_to_json(result, str(json_file))
+        if not export_json and input("\nExport all results to JSON? (y/n): ").lower().strip() == 'y':
+            export_all_to_json(results, output_prefix, root=args.file)
     
     return 0
 
@@ -1,28 +1,822 @@
 import os
+import asyncio
+import functools
+import hashlib
 import logging
 import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import requests
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator, Union
 from pathlib import Path
 
+import httpx
 import openai
 from resume_parser import ResumeParser
 
+try:
+    import orjson  # Optional: faster JSON for LLM responses, cache entries and JSONL records
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken  # Optional: exact token counts for the resume token budget
+except ImportError:
+    tiktoken = None
+
+try:
+    import h2  # noqa: F401  Optional: lets httpx multiplex OpenAI requests over HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import pyarrow as pa  # Optional: columnar Parquet sink for batch results
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are an expert HR professional and recruitment specialist. Always respond with valid JSON format as requested."
+GPT4O_MODEL = "gpt-4o"
+LLAMA_MODEL = "meta-llama/Llama-3.3-70B-Instruct-Turbo-Free"
+
+# Default location for the on-disk assessment cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "resume_match"
+# Subdirectory of the cache directory holding cached resume parsing results
+PARSE_CACHE_SUBDIR = "parsed"
+
+# OpenAI Batch API job states after which polling can stop
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Per-resume results streamed by batch runs, one JSON record per line
+BATCH_RESULTS_FILENAME = "results.jsonl"
+
+TOGETHER_CHAT_URL = "https://api.together.xyz/v1/chat/completions"
+
+# Shared HTTP connection pool sizing and timeouts (seconds) for LLM API requests
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_CONNECT_TIMEOUT = 5.0
+HTTP_READ_TIMEOUT = 120.0
+
+# Rough characters-per-token ratio used for the token budget when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+# Retries for rate-limited and transiently failing LLM requests, with jittered exponential backoff
+# starting at the base delay
+LLM_MAX_RETRIES = 5
+LLM_RETRY_BASE_DELAY = 2.0
+
+# Flex processing (service_tier="flex") is cheaper but slower and sometimes out of capacity: its requests get
+# a longer read timeout, and after this many retries of rate limit errors they fall back to the default tier
+FLEX_READ_TIMEOUT = 900.0
+FLEX_MAX_RETRIES = 2
+
+# With several API endpoints, how long (seconds) one that returned a rate limit error is passed over when
+# the response has no Retry-After header, and the weight of each new request in its latency average
+ENDPOINT_RATE_LIMIT_COOLDOWN = 10.0
+ENDPOINT_LATENCY_SMOOTHING = 0.2
+
+# HTTP statuses of LLM API errors that are worth retrying (rate limits and server-side failures)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JSON Schema object in which every property is required, as strict structured outputs demand."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured output schema for GPT-4o assessments, so responses are always valid JSON in this shape
+ASSESSMENT_SCHEMA = _strict_object({
+    "overall_score": {"type": "number", "description": "Match score from 0 to 10, where 10 is a perfect match"},
+    "summary": {"type": "string", "description": "Brief 2-3 sentence summary"},
+    "detailed_analysis": _strict_object({
+        "skills_match": {"type": "string"},
+        "experience_relevance": {"type": "string"},
+        "education_qualifications": {"type": "string"},
+        "industry_background": {"type": "string"}
+    }),
+    "strengths": _STRING_LIST,
+    "gaps_and_concerns": _STRING_LIST,
+    "recommendations": _strict_object({
+        "proceed_with_candidate": {"type": "string", "enum": ["Yes", "No", "Maybe"]},
+        "additional_information_needed": {"type": "string"},
+        "development_areas": _STRING_LIST
+    })
+})
+
+# The same assessment for each resume of a grouped prompt, identified by its number in the prompt
+BATCHED_ASSESSMENT_SCHEMA = _strict_object({
+    "results": {
+        "type": "array",
+        "items": _strict_object({"id": {"type": "integer"}, **ASSESSMENT_SCHEMA["properties"]})
+    }
+})
+
+# What every assessment must cover, shared by the single and grouped prompts
+ASSESSMENT_REQUIREMENTS = """
+1. **Overall Match Score**: A score from 0-10 (where 10 is a perfect match).
+2. **Detailed Analysis**: Skills match, experience relevance, education & qualifications, and industry background.
+3. **Strengths**: The top 3-5 strengths that make this candidate a good fit.
+4. **Gaps & Concerns**: Any significant gaps or concerns in the candidate's profile.
+5. **Recommendations**: Whether to proceed (Yes/No/Maybe), what to clarify, and development areas.
+"""
+
+# Response format spelled out in the prompt for models queried without a schema (LLaMA on Together.ai)
+OUTPUT_FORMAT_INSTRUCTIONS = """
+**OUTPUT FORMAT:**
+Please structure your response as a JSON object with the following format:
+
+{
+    "overall_score": <score_0_to_10>,
+    "summary": "<brief_2_3_sentence_summary>",
+    "detailed_analysis": {
+        "skills_match": "<analysis>",
+        "experience_relevance": "<analysis>",
+        "education_qualifications": "<analysis>",
+        "industry_background": "<analysis>"
+    },
+    "strengths": [
+        "<strength_1>",
+        "<strength_2>",
+        "<strength_3>"
+    ],
+    "gaps_and_concerns": [
+        "<gap_or_concern_1>",
+        "<gap_or_concern_2>"
+    ],
+    "recommendations": {
+        "proceed_with_candidate": "<Yes/No/Maybe>",
+        "additional_information_needed": "<what_to_clarify>",
+        "development_areas": [
+            "<area_1>",
+            "<area_2>"
+        ]
+    }
+}
+"""
+
+# With a screening model configured, scores in this inclusive band (or unparseable responses) are re-assessed by GPT-4o
+SCREENING_ESCALATION_RANGE = (4, 7)
+
+# Completion token cap per assessment. Typical assessments run 600-900 tokens; the headroom keeps a long one
+# from being cut off into invalid JSON, while rate limits reserve far fewer tokens than the old cap of 2000.
+ASSESSMENT_MAX_TOKENS = 1200
+
+# Optional embedding pre-filter: resumes less similar to the job profile than the threshold skip the LLM.
+# Resumes in flight are embedded together, up to the batch size per request (inputs are capped near the
+# model's 8191-token limit), waiting at most the linger time for a group to fill.
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_MAX_INPUT_TOKENS = 8000
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_BATCH_LINGER = 0.1
+
+# Grouped GPT-4o prompts: how long a partial group waits for more resumes, and the output token ceiling
+BATCH_PROMPT_LINGER = 0.5
+GPT4O_MAX_OUTPUT_TOKENS = 16384
+
+# Write buffer for report files, so a report reaches the disk in one or two system calls
+REPORT_BUFFER_SIZE = 1 << 16
+
+# Optional columnar copy of a batch run's results, written instead of per-resume reports
+BATCH_PARQUET_FILENAME = "results.parquet"
+PARQUET_ROW_GROUP_SIZE = 64
+
+# Machine-readable copy of the batch summary report
+BATCH_SUMMARY_JSON_FILENAME = "batch_assessment_summary.json"
+
+
+class MissingAPIKeyError(ValueError):
+    """Raised when no OpenAI or Together.ai API key is configured."""
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when it is installed (its decode errors are json.JSONDecodeError too)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when it is installed; compact unless ``indent`` asks for 2 spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Return True if an LLM API error is transient (a rate limit, server error or dropped connection)."""
+    if isinstance(error, (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError,
+                          requests.ConnectionError, requests.Timeout)):
+        return True
+    return (isinstance(error, requests.HTTPError)
+            and getattr(error.response, 'status_code', None) in RETRYABLE_STATUS_CODES)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the backoff before retry ``attempt`` (from 0), jittered so concurrent retries spread out."""
+    return LLM_RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.0)
+
+
+def _retry_after(error: Exception, default: float) -> float:
+    """Return the seconds an API error's Retry-After header asks to wait, or ``default``."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after', default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Return the cosine similarity of two embedding vectors."""
+    norm = math.sqrt(sum(x * x for x in a) * sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+
+def _estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Estimate the tokens a chat completion request counts against a tokens-per-minute limit."""
+    prompt_chars = sum(len(message['content']) for message in request['messages'])
+    # Rate limits count the requested completion tokens up front, not the ones eventually generated
+    return prompt_chars // CHARS_PER_TOKEN + request.get('max_tokens', 0)
+
+
+class RateLimiter:
+    """
+    Token-bucket limits on LLM requests per minute and tokens per minute.
+    
+    reserve() books capacity straight away, letting a bucket go into debt, and returns how long
+    the caller must wait before sending, so waiting requests go out in the order they were booked.
+    One limiter can be shared by threads and event loops.
+    """
+    
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        self.limits = (requests_per_minute, tokens_per_minute)
+        self._levels = [limit or 0.0 for limit in self.limits]  # Capacity left in each bucket
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: int) -> float:
+        """Book one request of ``tokens`` tokens and return the seconds to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            
+            delay = 0.0
+            for i, (limit, amount) in enumerate(zip(self.limits, (1, tokens))):
+                if not limit:
+                    continue
+                # Buckets refill continuously to their per-minute limit; one request never needs more than a full bucket
+                level = min(limit, self._levels[i] + elapsed * limit / 60) - min(amount, limit)
+                self._levels[i] = level
+                if level < 0:
+                    delay = max(delay, -level * 60 / limit)
+            return delay
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Return True if an LLM API error means the API key was rejected."""
+    if isinstance(error, openai.AuthenticationError):
+        return True
+    return isinstance(error, requests.HTTPError) and getattr(error.response, 'status_code', None) == 401
+
+
+def _json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a chat completion ``response_format`` constraining the response to ``schema``."""
+    return {"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+
+
+def _with_service_tier(request: Dict[str, Any], service_tier: Optional[str]) -> Dict[str, Any]:
+    """Return a copy of a chat completion request sent in ``service_tier``, or the request itself if None."""
+    if not service_tier:
+        return request
+    request = dict(request, service_tier=service_tier)
+    if service_tier == "flex":
+        request['timeout'] = httpx.Timeout(FLEX_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+    return request
+
+
+def _message_content(message) -> str:
+    """Return a chat completion message's text; a refusal has no content, so its explanation is used instead."""
+    return (message.content or getattr(message, 'refusal', None) or "").strip()
+
+
+def _needs_escalation(assessment: Dict[str, Any]) -> bool:
+    """Return True if a screening assessment has no usable score or a borderline one."""
+    try:
+        score = float(assessment.get('overall_score'))
+    except (TypeError, ValueError):
+        return True
+    low, high = SCREENING_ESCALATION_RANGE
+    return low <= score <= high
+
+
+@dataclass
+class AssessmentRecord:
+    """The JSON-serializable subset of an assessment result."""
+    
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('success', 'resume_path', 'job_profile_path', 'llm_assessment', 'resume_metadata', 'error')
+    
+    success: bool
+    resume_path: str
+    job_profile_path: str
+    llm_assessment: Optional[Dict[str, Any]]
+    resume_metadata: Optional[Dict[str, Any]]
+    error: Optional[str]
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "AssessmentRecord":
+        """Build a record from an assessment result (or a record already loaded from JSON)."""
+        parsing_result = result.get('resume_parsing_result')
+        return cls(
+            result['success'],
+            result['resume_path'],
+            result['job_profile_path'],
+            result.get('llm_assessment'),
+            parsing_result.get('metadata') if parsing_result else result.get('resume_metadata'),
+            result.get('error')
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict (shallow, unlike dataclasses.asdict)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# ResumeParser instance owned by a parsing pool worker process
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _parse_resume_in_worker(resume_path: str, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Parse a resume inside a pool worker process, reusing one ResumeParser per process."""
+    global _worker_parser
+    if _worker_parser is None or _worker_parser.cache_dir != cache_dir:
+        _worker_parser = ResumeParser(cache_dir=cache_dir)
+    # Assessments only use the combined text, so the per-page text is not split into chunks
+    return _worker_parser.parse_resume(resume_path, split=False)
+
+
+def iter_batch_results(results_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream assessment records from a batch results JSONL file.
+    
+    Lines that cannot be decoded (e.g. a record cut short by a crash) are skipped.
+    A missing file yields nothing.
+    """
+    try:
+        f = open(results_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _json_loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable record in {results_path}")
+
+
+def to_parquet_row(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an assessment result (or JSONL record) into one row of the Parquet results table."""
+    assessment = result.get('llm_assessment') or {}
+    score = assessment.get('overall_score')
+    try:
+        score = float(score) if score is not None else None
+    except (TypeError, ValueError):
+        score = None
+    recommendations = assessment.get('recommendations')
+    return {
+        'filename': os.path.basename(result['resume_path']),
+        'resume_path': result['resume_path'],
+        'job_profile_path': result['job_profile_path'],
+        'success': bool(result['success']),
+        'score': score,
+        'summary': assessment.get('summary'),
+        'strengths': [str(s) for s in assessment.get('strengths') or []],
+        'proceed_with_candidate': recommendations.get('proceed_with_candidate') if isinstance(recommendations, dict) else None,
+        'error': result.get('error')
+    }
+
+
+class ParquetResultSink:
+    """
+    Stream batch results into a single Parquet file.
+    
+    Rows are buffered and written as one row group every ``row_group_size`` results,
+    so memory stays flat regardless of batch size.
+    """
+    
+    def __init__(self, path: Union[str, Path], row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        if pa is None:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+        self.schema = pa.schema([
+            ('filename', pa.string()),
+            ('resume_path', pa.string()),
+            ('job_profile_path', pa.string()),
+            ('success', pa.bool_()),
+            ('score', pa.float64()),
+            ('summary', pa.string()),
+            ('strengths', pa.list_(pa.string())),
+            ('proceed_with_candidate', pa.string()),
+            ('error', pa.string())
+        ])
+        self.row_group_size = max(1, row_group_size)
+        self._rows = []
+        self._writer = pq.ParquetWriter(str(path), self.schema)
+    
+    def add(self, result: Dict[str, Any]):
+        """Buffer one result, flushing a row group when the buffer is full."""
+        self._rows.append(to_parquet_row(result))
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+    
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+    
+    def close(self):
+        """Write any buffered rows and finalize the file."""
+        self._flush()
+        self._writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def top_parquet_results(parquet_path: Union[str, Path], k: int = 5) -> List[Dict[str, Any]]:
+    """Return the ``k`` highest-scoring rows (filename and score) of a Parquet results file."""
+    if pa is None:
+        raise ImportError("Reading Parquet results requires pyarrow: pip install pyarrow")
+    table = pq.read_table(str(parquet_path), columns=['filename', 'score'])
+    table = table.filter(pc.is_valid(table['score']))
+    indices = pc.select_k_unstable(table, k, sort_keys=[('score', 'descending')])
+    return table.take(indices).to_pylist()
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Connection pooling and timeout settings shared by the sync and async OpenAI HTTP clients."""
+    return {
+        'http2': HTTP2_AVAILABLE,
+        'timeout': httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        'limits': httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                               max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model (cached, as building its BPE ranks is expensive)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Non-OpenAI models (e.g. LLaMA) get a close approximation of their token count
+        return tiktoken.get_encoding("o200k_base")
+
+
+def truncate_to_token_budget(text: str, max_tokens: int, model: str = GPT4O_MODEL) -> str:
+    """
+    Trim text to at most ``max_tokens`` tokens for the given model.
+    
+    Without tiktoken installed, the budget is approximated as ``CHARS_PER_TOKEN`` characters per token.
+    """
+    if tiktoken is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    
+    encoding = _get_encoding(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+@functools.lru_cache(maxsize=8)
+def _assessment_instructions(job_profile: str, output_format: bool) -> str:
+    """
+    Return the system message instructing an LLM to assess a resume against the job profile.
+    
+    It is the same for every resume in a batch, so it is built once per job profile.
+    ``output_format`` appends the response format for models queried without a schema.
+    """
+    instructions = f"""
+You are an expert HR professional and recruitment specialist. Your task is to assess how well a candidate's resume matches a given job profile description.
+
+Please analyze the following job profile description and the candidate's resume (provided in the next message), then provide a comprehensive assessment.
+
+**JOB PROFILE DESCRIPTION:**
+{job_profile}
+
+**ASSESSMENT REQUIREMENTS:**
+{ASSESSMENT_REQUIREMENTS}"""
+    if output_format:
+        instructions += OUTPUT_FORMAT_INSTRUCTIONS
+    return instructions + """
+Ensure your response is valid JSON and provides actionable insights for the hiring decision.
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _batched_assessment_instructions(job_profile: str) -> str:
+    """Return the system message for assessing a group of numbered resumes against the job profile."""
+    return f"""
+You are an expert HR professional and recruitment specialist. Your task is to assess how well each of several candidates' resumes (provided in the next message) matches a given job profile description.
+
+Assess every resume independently against the job profile; do not compare candidates with each other.
+
+**JOB PROFILE DESCRIPTION:**
+{job_profile}
+
+**ASSESSMENT REQUIREMENTS (for each resume):**
+{ASSESSMENT_REQUIREMENTS}"""
+
+
+def _as_messages(prompt: Union[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Return chat messages for a prompt: message lists as they are, plain strings as a user turn after SYSTEM_PROMPT."""
+    if isinstance(prompt, str):
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    return prompt
+
+
+def _request_signature(request: Dict[str, Any]) -> str:
+    """Hash an LLM request payload, rendered with placeholder inputs, into a prompt signature."""
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def _job_profile_hasher(job_profile: str, model: str, prompt_signature: str = ""):
+    """
+    Return a SHA-256 state primed with the model, prompt signature and job profile.
+    
+    Batch runs assess many resumes against one job profile, so the shared prefix is
+    hashed once and callers ``copy()`` the state before adding the resume text.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(model.encode('utf-8') + b"||")
+    hasher.update(prompt_signature.encode('utf-8') + b"||")
+    hasher.update(job_profile.encode('utf-8') + b"||")
+    return hasher
+
+
+class _ClientPool:
+    """
+    Async OpenAI clients for one or more OpenAI-compatible endpoints, bound to one event loop.
+    
+    Each request goes to the endpoint with the lowest expected wait (its average latency times
+    its requests in flight, ties taken in turn), skipping endpoints that recently returned a
+    rate limit error, so a large batch is spread over several accounts' quotas.
+    The clients share one HTTP connection pool, as the API key is sent per request.
+    """
+    
+    def __init__(self, endpoints: List[Tuple["openai.AsyncOpenAI", Optional[RateLimiter]]],
+                 http_client: "httpx.AsyncClient"):
+        self.http_client = http_client
+        self.clients = [client for client, _ in endpoints]
+        self.rate_limiters = [rate_limiter for _, rate_limiter in endpoints]
+        self._latency = [0.0] * len(endpoints)  # Smoothed seconds per request; 0 until first measured
+        self._in_flight = [0] * len(endpoints)
+        self._cooldown_until = [0.0] * len(endpoints)
+        self._turn = 0
+    
+    def has_available_endpoint(self) -> bool:
+        """Return True if some endpoint is not cooling down after a rate limit error."""
+        now = time.monotonic()
+        return any(until <= now for until in self._cooldown_until)
+    
+    def _pick(self) -> int:
+        """Return the index of the endpoint to send the next request to."""
+        now = time.monotonic()
+        indices = range(len(self.clients))
+        available = [i for i in indices if self._cooldown_until[i] <= now]
+        if not available:
+            available = [min(indices, key=self._cooldown_until.__getitem__)]
+        
+        turn, self._turn = self._turn, (self._turn + 1) % len(self.clients)
+        return min(available, key=lambda i: (self._latency[i] * (self._in_flight[i] + 1),
+                                             (i - turn) % len(self.clients)))
+    
+    async def create(self, request: Dict[str, Any], tokens: int):
+        """Send one chat completion request, within its endpoint's rate limits, and return the response."""
+        return await self._send(lambda client: client.chat.completions.create(**request), tokens)
+    
+    async def embed(self, request: Dict[str, Any], tokens: int):
+        """Send one embeddings request, within its endpoint's rate limits, and return the response."""
+        return await self._send(lambda client: client.embeddings.create(**request), tokens)
+    
+    async def _send(self, call, tokens: int):
+        i = self._pick()
+        self._in_flight[i] += 1
+        try:
+            rate_limiter = self.rate_limiters[i]
+            if rate_limiter is not None:
+                delay = rate_limiter.reserve(tokens)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            
+            started = time.monotonic()
+            try:
+                response = await call(self.clients[i])
+            except openai.RateLimitError as e:
+                self._cooldown_until[i] = time.monotonic() + _retry_after(e, ENDPOINT_RATE_LIMIT_COOLDOWN)
+                raise
+            
+            elapsed = time.monotonic() - started
+            previous = self._latency[i]
+            self._latency[i] = elapsed if not previous else (
+                previous + ENDPOINT_LATENCY_SMOOTHING * (elapsed - previous))
+            return response
+        finally:
+            self._in_flight[i] -= 1
+    
+    async def close(self):
+        """Close the HTTP connections shared by the endpoints' clients."""
+        await self.http_client.aclose()
+
+
+class _PromptBatcher:
+    """
+    Group concurrent GPT-4o batch assessments into multi-resume prompts.
+    
+    Each assess() call queues its resume until ``size`` resumes are waiting or ``linger``
+    seconds have passed, then one request assesses the whole group against the shared
+    job profile. Resumes the grouped response does not answer are assessed on their own.
+    """
+    
+    def __init__(self, matcher: "ResumeJobMatcher", aclient: _ClientPool, job_profile: str,
+                 size: int, linger: float = BATCH_PROMPT_LINGER):
+        self.matcher = matcher
+        self.aclient = aclient
+        self.job_profile = job_profile
+        self.size = size
+        self.linger = linger
+        # Grouped answers are cached apart from single-resume ones, under the grouped prompt's signature
+        self.prompt_signature = matcher._grouped_prompt_signature(size)
+        self._pending = []  # (resume_text, future) pairs waiting for the next request
+        self._timer = None
+        self._requests = set()  # Keeps in-flight group requests referenced until they finish
+    
+    async def assess(self, resume_text: str) -> Dict[str, Any]:
+        """Return the assessment of one resume, sent as part of a group."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((resume_text, future))
+        if len(self._pending) >= self.size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        
+        assessment = await future
+        if assessment is None:
+            prompt = self.matcher.create_assessment_prompt(self.job_profile, resume_text)
+            assessment = await self.matcher.query_gpt4o_async(self.aclient, prompt)
+        elif self.matcher.screening_model:
+            # The group was answered by the screening model; borderline resumes go to GPT-4o one by one
+            prompt = self.matcher.create_assessment_prompt(self.job_profile, resume_text)
+            assessment = await self.matcher._screen_async(self.aclient, prompt, assessment)
+        return assessment
+    
+    def _flush(self):
+        """Send the waiting resumes as one request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        group, self._pending = self._pending, []
+        if group:
+            request = asyncio.ensure_future(self._send(group))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+    
+    async def _send(self, group: List[Tuple[str, "asyncio.Future"]]):
+        try:
+            assessments = await self.matcher.query_gpt4o_batched_async(
+                self.aclient, self.job_profile, [resume_text for resume_text, _ in group]
+            )
+        except Exception as e:
+            for _, future in group:
+                if not future.done():  # Its assessment may have timed out meanwhile
+                    future.set_exception(e)
+            return
+        for (_, future), assessment in zip(group, assessments):
+            if not future.done():
+                future.set_result(assessment)
+
+
+class _EmbeddingGate:
+    """
+    Measure how similar resumes are to the job profile, by the cosine similarity of their embeddings.
+    
+    Concurrent similarity() calls queue their resumes, like _PromptBatcher, so that up to ``size``
+    resumes are embedded in a single request. The job profile is embedded along with the first group.
+    """
+    
+    def __init__(self, matcher: "ResumeJobMatcher", aclient: _ClientPool, job_profile: str,
+                 size: int = EMBEDDING_BATCH_SIZE, linger: float = EMBEDDING_BATCH_LINGER):
+        self.matcher = matcher
+        self.aclient = aclient
+        self.job_profile = job_profile
+        self.size = size
+        self.linger = linger
+        self._job_profile_embedding = None
+        self._pending = []  # (resume_text, future) pairs waiting for the next request
+        self._timer = None
+        self._requests = set()  # Keeps in-flight embedding requests referenced until they finish
+    
+    async def similarity(self, resume_text: str) -> float:
+        """Return the cosine similarity of a resume to the job profile."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((resume_text, future))
+        if len(self._pending) >= self.size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Send the waiting resumes as one request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        group, self._pending = self._pending, []
+        if group:
+            request = asyncio.ensure_future(self._send(group))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+    
+    async def _send(self, group: List[Tuple[str, "asyncio.Future"]]):
+        texts = [resume_text for resume_text, _ in group]
+        with_job_profile = self._job_profile_embedding is None
+        if with_job_profile:
+            texts.insert(0, self.job_profile)
+        try:
+            embeddings = await self.matcher.embed_texts_async(self.aclient, texts)
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        if with_job_profile:
+            self._job_profile_embedding = embeddings.pop(0)
+        for (_, future), embedding in zip(group, embeddings):
+            if not future.done():
+                future.set_result(_cosine_similarity(embedding, self._job_profile_embedding))
+
 
 class ResumeJobMatcher:
     """
     A tool to assess how well a resume matches a job profile description using a LLM.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None,
+                 max_input_tokens: Optional[int] = None, screening_model: Optional[str] = None,
+                 requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 endpoints: Optional[List[Tuple[str, Optional[str]]]] = None,
+                 embedding_threshold: Optional[float] = None, service_tier: Optional[str] = None):
         """
         Initialize the resume job matcher.
         
         Args:
             api_key (Optional[str]): OpenAI or Together.ai API key. If not provided, will try to get from environment.
+            cache_dir (Optional[str]): Directory for caching LLM assessments (and, under ``parsed/``, resume
+                parsing results) on disk. Caching is disabled if not provided.
+            max_input_tokens (Optional[int]): Token budget for the resume text sent to the LLM; longer
+                resumes are truncated. No limit if not provided.
+            screening_model (Optional[str]): Cheaper OpenAI model (e.g. "gpt-4o-mini") that assesses each
+                resume first; GPT-4o is only queried when its score is borderline. Disabled if not provided.
+            requests_per_minute (Optional[float]): Cap on LLM requests per minute, e.g. your API tier's RPM limit
+            tokens_per_minute (Optional[float]): Cap on estimated LLM tokens per minute (prompt plus max_tokens),
+                e.g. your API tier's TPM limit
+            endpoints (Optional[List[Tuple[str, Optional[str]]]]): Additional (api_key, base_url) pairs of
+                OpenAI-compatible endpoints, e.g. other accounts or Azure OpenAI deployments. Concurrent batch
+                assessments are spread across them and the main API key, each within its own rate limits;
+                a base_url of None means the OpenAI API.
+            embedding_threshold (Optional[float]): In concurrent batch assessments, resumes whose embedding
+                cosine similarity to the job profile is below this value are not sent to the LLM. Disabled if not provided.
+            service_tier (Optional[str]): OpenAI service tier for realtime requests, e.g. "flex" for cheaper,
+                slower processing on models that offer it; flex requests fall back to the default tier
+                when flex capacity is unavailable. The project's default tier if not provided.
         """
         self.api_key = (
             api_key
@@ -31,14 +825,66 @@ class ResumeJobMatcher:
         )
 
         if not self.api_key:
-            raise ValueError("API key is required. Set OPENAI_API_KEY or TOGETHER_API_KEY environment variable or pass api_key parameter.")
+            raise MissingAPIKeyError("API key is required. Set OPENAI_API_KEY or TOGETHER_API_KEY environment variable or pass api_key parameter.")
 
-        if os.getenv('OPENA_API_KEY'):
-            self.client = openai.OpenAI(api_key=self.api_key)
+        # One pooled, keep-alive connection set per matcher, so concurrent and repeated
+        # assessments reuse TCP/TLS connections instead of opening one per request.
+        # The SDK's own retries are disabled: _with_retries is the only retry layer, so every
+        # attempt goes through its jittered backoff and the rate limiter.
+        if os.getenv('OPENAI_API_KEY'):
+            self.client = openai.OpenAI(api_key=self.api_key, max_retries=0,
+                                        http_client=httpx.Client(**_http_client_options()))
         else:
             self.client = None  # Together uses raw HTTP requests
+        
+        self.http_session = requests.Session()
+        self.http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=HTTP_MAX_CONNECTIONS))
 
-        self.resume_parser = ResumeParser()
+        self.model_name = GPT4O_MODEL if self.client is not None else LLAMA_MODEL
+        self.max_input_tokens = max_input_tokens
+        
+        if screening_model and self.client is None:
+            logger.warning("A screening model requires the OpenAI API; assessing every resume with the default model")
+            screening_model = None
+        self.screening_model = screening_model
+        
+        if embedding_threshold is not None and self.client is None:
+            logger.warning("The embedding pre-filter requires the OpenAI API; assessing every resume with the LLM")
+            embedding_threshold = None
+        self.embedding_threshold = embedding_threshold
+        
+        if service_tier and self.client is None:
+            logger.warning("A service tier requires the OpenAI API; ignoring it")
+            service_tier = None
+        self.service_tier = service_tier
+        
+        # Throttle below the API's per-minute limits rather than hitting them and backing off
+        self.rate_limiter = (RateLimiter(requests_per_minute, tokens_per_minute)
+                             if requests_per_minute or tokens_per_minute else None)
+        
+        if endpoints and self.client is None:
+            logger.warning("Additional API endpoints require the OpenAI API; ignoring them")
+            endpoints = None
+        # The main API key shares its rate limiter with synchronous requests; every other endpoint has its own quota
+        self.endpoints = [(self.api_key, None, self.rate_limiter)] + [
+            (endpoint_key, base_url, RateLimiter(requests_per_minute, tokens_per_minute) if self.rate_limiter else None)
+            for endpoint_key, base_url in endpoints or []
+        ]
+
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Changing the prompt template, system prompt or request settings invalidates cached assessments
+        signature_request = self._build_gpt4o_request(self.create_assessment_prompt("{job_profile}", "{resume_text}"))
+        if self.screening_model:
+            signature_request['screening_model'] = self.screening_model
+        self._prompt_signature = _request_signature(signature_request)
+
+        self.parse_cache_dir = self.cache_dir / PARSE_CACHE_SUBDIR if self.cache_dir else None
+        self.resume_parser = ResumeParser(cache_dir=self.parse_cache_dir)
+        # PyMuPDF is not thread-safe, so concurrent batch assessments share
+        # this lock around PDF parsing and only overlap the LLM round-trips.
+        self._parse_lock = threading.Lock()
 
         logger.info(f"ResumeJobMatcher initialized successfully.")
     
@@ -75,267 +921,526 @@ class ResumeJobMatcher:
             logger.error(f"Error reading job profile file {file_path}: {str(e)}")
             raise
     
-    def create_assessment_prompt(self, job_profile: str, resume_text: str) -> str:
+    def create_assessment_prompt(self, job_profile: str, resume_text: str) -> List[Dict[str, str]]:
         """
-        Create a prompt for an LLM to assess resume-job fit.
+        Create the chat messages for an LLM to assess resume-job fit.
+        
+        The instructions and job profile form the system message, which is identical for every
+        resume assessed against the job profile, so the API can cache that prompt prefix;
+        the user message carries only the resume.
         
         Args:
             job_profile (str): Job profile description
             resume_text (str): Resume content
             
         Returns:
-            str: Formatted prompt for an LLM
+            List[Dict[str, str]]: System and user messages for an LLM
         """
-        prompt = f"""
-You are an expert HR professional and recruitment specialist. Your task is to assess how well a candidate's resume matches a given job profile description.
-
-Please analyze the following job profile description and resume, then provide a comprehensive assessment.
-
-**JOB PROFILE DESCRIPTION:**
-{job_profile}
-
-**CANDIDATE RESUME:**
-{resume_text}
+        # GPT-4o responses are constrained by ASSESSMENT_SCHEMA; other models need the format spelled out
+        return [
+            {"role": "system", "content": _assessment_instructions(job_profile, self.client is None)},
+            {"role": "user", "content": f"**CANDIDATE RESUME:**\n{resume_text}"}
+        ]
+    
+    def create_batched_assessment_prompt(self, job_profile: str, resume_texts: List[str]) -> List[Dict[str, str]]:
+        """
+        Create the chat messages for an LLM to assess several resumes against one job profile.
+        
+        The instructions and job profile form a shared system message, followed by the numbered
+        resumes; the response holds one assessment per resume, identified by its number. The response
+        structure comes from BATCHED_ASSESSMENT_SCHEMA, so these messages are only used with OpenAI models.
+        
+        Args:
+            job_profile (str): Job profile description
+            resume_texts (List[str]): Resume contents, numbered from 1 in the prompt
+            
+        Returns:
+            List[Dict[str, str]]: System and user messages for an LLM
+        """
+        resumes = "\n\n".join(
+            f"**RESUME[{i}]:**\n{resume_text}" for i, resume_text in enumerate(resume_texts, 1)
+        )
+        return [
+            {"role": "system", "content": _batched_assessment_instructions(job_profile)},
+            {"role": "user", "content": f"""**CANDIDATE RESUMES:**
+{resumes}
 
-**ASSESSMENT REQUIREMENTS:**
+Return one entry in "results" for each of the {len(resume_texts)} resumes, with "id" set to the resume's number."""}
+        ]
 
-1. **Overall Match Score**: Provide a score from 0-10 (where 10 is a perfect match) that represents how well this resume fits the job profile.
+    def query_llama33_70b(self, prompt: Union[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+        """
+        Query LLaMA 3.3 70B Instruct model from Together.ai with the assessment prompt.
 
-2. **Detailed Analysis**: Provide a structured analysis covering:
-   - **Skills Match**: How well do the candidate's skills align with job requirements?
-   - **Experience Relevance**: How relevant is their work experience to the role?
-   - **Education & Qualifications**: Do they meet the educational requirements?
-   - **Industry Background**: How well does their industry experience align?
+        Args:
+            prompt (Union[str, List[Dict[str, str]]]): Messages from create_assessment_prompt, or a plain prompt string
 
-3. **Strengths**: List the top 3-5 strengths that make this candidate a good fit.
+        Returns:
+            Dict[str, Any]: Parsed response from the model
 
-4. **Gaps & Concerns**: Identify any significant gaps or concerns in the candidate's profile.
+        Raises:
+            Exception: If there's an error with the API call
+        """
+        try:
+            logger.info("Sending assessment request to LLaMA 3.3 70B via Together.ai")
+            
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            data = {
+                "model": LLAMA_MODEL,
+                "messages": _as_messages(prompt),
+                #"temperature": 0.3,
+                #"max_tokens": 2000
+            }
 
-5. **Recommendations**: Provide specific recommendations for:
-   - Whether to proceed with this candidate (Yes/No/Maybe)
-   - What additional information or clarification might be needed
-   - Areas where the candidate might need development
+            self._wait_for_rate_limit(data)
+            response = self.http_session.post(TOGETHER_CHAT_URL, headers=headers, json=data,
+                                              timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+            response.raise_for_status()
+            content = response.json()["choices"][0]["message"]["content"].strip()
 
-**OUTPUT FORMAT:**
-Please structure your response as a JSON object with the following format:
+            return self._parse_assessment_content(content, "LLaMA")
 
-{{
-    "overall_score": <score_0_to_10>,
-    "summary": "<brief_2_3_sentence_summary>",
-    "detailed_analysis": {{
-        "skills_match": "<analysis>",
-        "experience_relevance": "<analysis>",
-        "education_qualifications": "<analysis>",
-        "industry_background": "<analysis>"
-    }},
-    "strengths": [
-        "<strength_1>",
-        "<strength_2>",
-        "<strength_3>"
-    ],
-    "gaps_and_concerns": [
-        "<gap_or_concern_1>",
-        "<gap_or_concern_2>"
-    ],
-    "recommendations": {{
-        "proceed_with_candidate": "<Yes/No/Maybe>",
-        "additional_information_needed": "<what_to_clarify>",
-        "development_areas": [
-            "<area_1>",
-            "<area_2>"
-        ]
-    }}
-}}
-
-Ensure your response is valid JSON and provides actionable insights for the hiring decision.
-"""
-        return prompt
+        except Exception as e:
+            logger.error(f"Error querying LLaMA 3.3 70B via Together.ai: {str(e)}")
+            raise
 
-    def query_llama33_70b(self, prompt: str) -> Dict[str, Any]:
+    def query_gpt4o(self, prompt: Union[str, List[Dict[str, str]]], model: str = GPT4O_MODEL,
+                    service_tier: Optional[str] = None) -> Dict[str, Any]:
         """
-        Query LLaMA 3.3 70B Instruct model from Together.ai with the assessment prompt.
-
+        Query GPT-4o (or another OpenAI chat model) with the assessment prompt.
+        
         Args:
-            prompt (str): The formatted prompt for assessment
-
+            prompt (Union[str, List[Dict[str, str]]]): Messages from create_assessment_prompt, or a plain prompt string
+            model (str): OpenAI model to query
+            service_tier (Optional[str]): OpenAI service tier to request, e.g. "flex"
+            
         Returns:
             Dict[str, Any]: Parsed response from the model
-
+            
         Raises:
-            Exception: If there's an error with the API call
+            Exception: If there's an error with the OpenAI API call
+        """
+        try:
+            logger.info(f"Sending assessment request to {model}")
+            
+            request = _with_service_tier(self._build_gpt4o_request(prompt, model), service_tier)
+            self._wait_for_rate_limit(request)
+            response = self.client.chat.completions.create(**request)
+            
+            # Extract the response content
+            content = _message_content(response.choices[0].message)
+            
+            return self._parse_assessment_content(content, model)
+            
+        except Exception as e:
+            logger.error(f"Error querying {model}: {str(e)}")
+            raise
+    
+    def query_llm(self, prompt: Union[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+        """
+        Query the configured LLM: GPT-4o when an OpenAI key is available, otherwise LLaMA 3.3 70B on Together.ai.
+        
+        With a screening model configured, it answers first and only borderline results are
+        re-assessed by GPT-4o. Rate-limited and transiently failing requests are retried with
+        exponential backoff, up to ``LLM_MAX_RETRIES`` times.
+        
+        Args:
+            prompt (Union[str, List[Dict[str, str]]]): Messages from create_assessment_prompt, or a plain prompt string
+            
+        Returns:
+            Dict[str, Any]: Parsed response from the model
+        """
+        if self.client is None:
+            return self._with_retries(self.query_llama33_70b, prompt)
+        if self.screening_model is None:
+            return self._query_gpt4o_in_tier(prompt, GPT4O_MODEL)
+        
+        screening = self._query_gpt4o_in_tier(prompt, self.screening_model)
+        if not _needs_escalation(screening):
+            screening['model'] = self.screening_model
+            return screening
+        logger.info(f"{self.screening_model} score is borderline; re-assessing with {GPT4O_MODEL}")
+        return self._escalated(self._query_gpt4o_in_tier(prompt, GPT4O_MODEL), screening)
+    
+    def _query_gpt4o_in_tier(self, prompt: Union[str, List[Dict[str, str]]], model: str) -> Dict[str, Any]:
+        """Query an OpenAI model with retries in the configured service tier, falling back from flex to the default tier."""
+        if self.service_tier == "flex":
+            try:
+                return self._with_retries(self.query_gpt4o, prompt, model, "flex", max_retries=FLEX_MAX_RETRIES)
+            except openai.RateLimitError:
+                logger.warning(f"Flex processing is unavailable for {model}; retrying in the default service tier")
+            return self._with_retries(self.query_gpt4o, prompt, model)
+        return self._with_retries(self.query_gpt4o, prompt, model, self.service_tier)
+    
+    def _with_retries(self, query, *args, max_retries: int = LLM_MAX_RETRIES) -> Dict[str, Any]:
+        """Call ``query(*args)``, retrying transient LLM API errors with exponential backoff."""
+        for attempt in range(max_retries + 1):
+            try:
+                return query(*args)
+            except Exception as e:
+                if not _is_retryable_error(e) or attempt == max_retries:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"LLM API request failed ({str(e)}); retrying in {delay:.0f}s ({attempt + 1}/{max_retries})")
+                time.sleep(delay)
+    
+    def _wait_for_rate_limit(self, request: Dict[str, Any]):
+        """Block until the rate limiter allows sending ``request``."""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(_estimate_request_tokens(request))
+            if delay > 0:
+                time.sleep(delay)
+    
+    def _new_async_client(self) -> _ClientPool:
+        """
+        Create async OpenAI clients for the configured endpoints, with the same pooling and timeouts as ``self.client``.
+        
+        An httpx.AsyncClient is bound to the event loop it first runs on, so each batch run creates its
+        own, which stays open (keeping connections warm) until the run ends.
+        """
+        http_client = httpx.AsyncClient(**_http_client_options())
+        return _ClientPool([
+            # No SDK retries, as for self.client: _with_retries_async retries, failing over to another endpoint
+            (openai.AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=http_client),
+             rate_limiter)
+            for api_key, base_url, rate_limiter in self.endpoints
+        ], http_client)
+    
+    async def query_gpt4o_async(self, aclient: _ClientPool, prompt: Union[str, List[Dict[str, str]]],
+                                model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Query GPT-4o with the assessment prompt without blocking the event loop.
+        
+        Like query_llm, transient errors are retried with exponential backoff and,
+        unless ``model`` is given, a configured screening model answers first.
+        
+        Args:
+            aclient (_ClientPool): Clients from _new_async_client for the running event loop
+            prompt (Union[str, List[Dict[str, str]]]): Messages from create_assessment_prompt, or a plain prompt string
+            model (Optional[str]): OpenAI model to query directly, skipping screening
+            
+        Returns:
+            Dict[str, Any]: Parsed response from the model
+        """
+        if model is None:
+            if self.screening_model:
+                screening = await self.query_gpt4o_async(aclient, prompt, self.screening_model)
+                return await self._screen_async(aclient, prompt, screening)
+            model = GPT4O_MODEL
+        
+        logger.info(f"Sending assessment request to {model}")
+        content = await self._complete_gpt4o_async(aclient, self._build_gpt4o_request(prompt, model))
+        return self._parse_assessment_content(content, model)
+    
+    async def _screen_async(self, aclient: _ClientPool, prompt: Union[str, List[Dict[str, str]]],
+                            screening: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a screening model's assessment, or GPT-4o's when the screening score is borderline."""
+        if not _needs_escalation(screening):
+            screening['model'] = self.screening_model
+            return screening
+        logger.info(f"{self.screening_model} score is borderline; re-assessing with {GPT4O_MODEL}")
+        return self._escalated(await self.query_gpt4o_async(aclient, prompt, GPT4O_MODEL), screening)
+    
+    def _escalated(self, assessment: Dict[str, Any], screening: Dict[str, Any]) -> Dict[str, Any]:
+        """Record on a GPT-4o assessment the screening result it replaced."""
+        assessment['model'] = GPT4O_MODEL
+        assessment['screening_model'] = self.screening_model
+        assessment['screening_score'] = screening.get('overall_score')
+        return assessment
+    
+    async def query_gpt4o_batched_async(self, aclient: _ClientPool, job_profile: str,
+                                        resume_texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Assess several resumes against one job profile with a single GPT-4o request
+        (or screening model request, when one is configured).
+        
+        Args:
+            aclient (_ClientPool): Clients from _new_async_client for the running event loop
+            job_profile (str): Job profile description
+            resume_texts (List[str]): Resume contents, in order
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: One assessment per resume, or None for resumes
+                missing from the response (e.g. when it was not valid JSON)
+        """
+        model = self.screening_model or GPT4O_MODEL
+        logger.info(f"Sending grouped assessment request for {len(resume_texts)} resumes to {model}")
+        request = self._build_batched_gpt4o_request(job_profile, resume_texts)
+        content = await self._complete_gpt4o_async(aclient, request)
+        
+        response = self._parse_assessment_content(content, model)
+        assessments = {}
+        for item in response.get('results') or []:
+            if isinstance(item, dict) and 'id' in item:
+                assessments[str(item.pop('id'))] = item
+        
+        results = [assessments.get(str(i)) for i in range(1, len(resume_texts) + 1)]
+        missing = results.count(None)
+        if missing:
+            logger.warning(f"Grouped GPT-4o response is missing {missing} of {len(resume_texts)} assessments")
+        return results
+    
+    def _build_batched_gpt4o_request(self, job_profile: str, resume_texts: List[str]) -> Dict[str, Any]:
+        """Build the grouped assessment request for query_gpt4o_batched_async."""
+        request = self._build_gpt4o_request(self.create_batched_assessment_prompt(job_profile, resume_texts),
+                                            self.screening_model or GPT4O_MODEL)
+        # Every resume needs room for its own assessment in the one response
+        request['max_tokens'] = min(request['max_tokens'] * len(resume_texts), GPT4O_MAX_OUTPUT_TOKENS)
+        request['response_format'] = _json_schema_format("batched_assessment", BATCHED_ASSESSMENT_SCHEMA)
+        return request
+    
+    def _grouped_prompt_signature(self, size: int) -> str:
+        """
+        Return the prompt signature of assessments grouped ``size`` resumes per prompt.
+        
+        It covers the grouped request (its template and scaled max_tokens) as well as the
+        single-resume prompt that assesses resumes the grouped response misses or screens out.
+        """
+        grouped_request = self._build_batched_gpt4o_request("{job_profile}", ["{resume_text}"] * size)
+        return _request_signature({'grouped': grouped_request, 'single': self._prompt_signature})
+    
+    async def _complete_gpt4o_async(self, aclient: _ClientPool, request: Dict[str, Any]) -> str:
         """
-        try:
-            logger.info("Sending assessment request to LLaMA 3.3 70B via Together.ai")
-            
-            url = "https://api.together.xyz/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "model": "meta-llama/Llama-3.3-70B-Instruct-Turbo-Free",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert HR professional and recruitment specialist. Always respond with valid JSON format as requested."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                #"temperature": 0.3,
-                #"max_tokens": 2000
-            }
-
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"].strip()
-
+        Send a chat completion request within the rate limits and return its content,
+        retrying transient errors with exponential backoff.
+        
+        A rate-limited request is retried at once on another endpoint when one is available.
+        Requests go to the configured service tier; flex requests fall back to the default tier.
+        """
+        tokens = _estimate_request_tokens(request)
+        if self.service_tier == "flex":
+            flex_request = _with_service_tier(request, "flex")
             try:
-                assessment_result = json.loads(content)
-                logger.info("Successfully received and parsed Together.ai response")
-                return assessment_result
-            except json.JSONDecodeError as e:
-                logger.warning(f"LLaMA response was not valid JSON: {e}")
-                return {
-                    "overall_score": None,
-                    "summary": content,
-                    "detailed_analysis": {},
-                    "strengths": [],
-                    "gaps_and_concerns": [],
-                    "recommendations": {},
-                    "raw_response": content,
-                    "parsing_error": str(e)
-                }
-
-        except Exception as e:
-            logger.error(f"Error querying LLaMA 3.3 70B via Together.ai: {str(e)}")
-            raise
-
-
-    def query_gpt4o(self, prompt: str) -> Dict[str, Any]:
+                response = await self._with_retries_async(aclient, lambda: aclient.create(flex_request, tokens),
+                                                          request['model'], max_retries=FLEX_MAX_RETRIES)
+                return _message_content(response.choices[0].message)
+            except openai.RateLimitError:
+                logger.warning(f"Flex processing is unavailable for {request['model']}; retrying in the default service tier")
+        else:
+            request = _with_service_tier(request, self.service_tier)
+        
+        response = await self._with_retries_async(aclient, lambda: aclient.create(request, tokens), request['model'])
+        return _message_content(response.choices[0].message)
+    
+    async def embed_texts_async(self, aclient: _ClientPool, texts: List[str]) -> List[List[float]]:
         """
-        Query GPT-4o with the assessment prompt.
+        Embed texts with ``EMBEDDING_MODEL`` in one request, each capped at ``EMBEDDING_MAX_INPUT_TOKENS``.
         
         Args:
-            prompt (str): The formatted prompt for assessment
+            aclient (_ClientPool): Clients from _new_async_client for the running event loop
+            texts (List[str]): Texts to embed
             
         Returns:
-            Dict[str, Any]: Parsed response from GPT-4o
-            
-        Raises:
-            Exception: If there's an error with the OpenAI API call
+            List[List[float]]: One embedding per text, in order
         """
-        try:
-            logger.info("Sending assessment request to GPT-4o")
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert HR professional and recruitment specialist. Always respond with valid JSON format as requested."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent, focused responses
-                max_tokens=2000
-            )
-            
-            # Extract the response content
-            content = response.choices[0].message.content.strip()
-            
-            # Try to parse as JSON
+        inputs = await asyncio.to_thread(
+            lambda: [truncate_to_token_budget(text, EMBEDDING_MAX_INPUT_TOKENS, EMBEDDING_MODEL) for text in texts])
+        request = {"model": EMBEDDING_MODEL, "input": inputs}
+        tokens = sum(len(text) for text in inputs) // CHARS_PER_TOKEN
+        response = await self._with_retries_async(aclient, lambda: aclient.embed(request, tokens), EMBEDDING_MODEL)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    
+    async def _with_retries_async(self, aclient: _ClientPool, send, model: str, max_retries: int = LLM_MAX_RETRIES):
+        """Await ``send()``, a request sent through ``aclient``, retrying transient LLM API errors like _with_retries."""
+        for attempt in range(max_retries + 1):
             try:
-                assessment_result = json.loads(content)
-                logger.info("Successfully received and parsed GPT-4o response")
-                return assessment_result
-            except json.JSONDecodeError as e:
-                logger.warning(f"GPT-4o response was not valid JSON: {e}")
-                # Return a structured fallback response
-                return {
-                    "overall_score": None,
-                    "summary": content,
-                    "detailed_analysis": {},
-                    "strengths": [],
-                    "gaps_and_concerns": [],
-                    "recommendations": {},
-                    "raw_response": content,
-                    "parsing_error": str(e)
-                }
-            
-        except Exception as e:
-            logger.error(f"Error querying GPT-4o: {str(e)}")
-            raise
+                return await send()
+            except Exception as e:
+                if not _is_retryable_error(e) or attempt == max_retries:
+                    logger.error(f"Error querying {model}: {str(e)}")
+                    raise
+                if isinstance(e, openai.RateLimitError) and aclient.has_available_endpoint():
+                    logger.warning(f"LLM API request was rate limited; retrying on another endpoint ({attempt + 1}/{max_retries})")
+                    continue
+                delay = _retry_delay(attempt)
+                logger.warning(f"LLM API request failed ({str(e)}); retrying in {delay:.0f}s ({attempt + 1}/{max_retries})")
+                await asyncio.sleep(delay)
+    
+    def _build_gpt4o_request(self, prompt: Union[str, List[Dict[str, str]]], model: str = GPT4O_MODEL) -> Dict[str, Any]:
+        """Build the GPT-4o chat completion payload shared by the realtime and Batch API paths."""
+        return {
+            "model": model,
+            "messages": _as_messages(prompt),
+            "temperature": 0.3,  # Lower temperature for more consistent, focused responses
+            "max_tokens": ASSESSMENT_MAX_TOKENS,
+            "response_format": _json_schema_format("assessment", ASSESSMENT_SCHEMA)
+        }
+    
+    def _parse_assessment_content(self, content: str, model_name: str) -> Dict[str, Any]:
+        """Parse a model response as JSON, falling back to a structured error response."""
+        try:
+            assessment_result = _json_loads(content)
+            logger.info(f"Successfully received and parsed {model_name} response")
+            return assessment_result
+        except json.JSONDecodeError as e:
+            logger.warning(f"{model_name} response was not valid JSON: {e}")
+            # Return a structured fallback response
+            return {
+                "overall_score": None,
+                "summary": content,
+                "detailed_analysis": {},
+                "strengths": [],
+                "gaps_and_concerns": [],
+                "recommendations": {},
+                "raw_response": content,
+                "parsing_error": str(e)
+            }
     
-    def assess_resume_job_fit(self, resume_path: str, job_profile_path: str) -> Dict[str, Any]:
+    def assess_resume_job_fit(self, resume_path: str, job_profile_path: str,
+                              job_profile: Optional[str] = None,
+                              resume_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Complete pipeline to assess how well a resume fits a job profile.
         
         Args:
             resume_path (str): Path to the resume PDF file
             job_profile_path (str): Path to the job profile text file
+            job_profile (Optional[str]): Pre-loaded job profile text. When given, the file at
+                job_profile_path is not read again (useful when assessing many resumes).
+            resume_result (Optional[Dict[str, Any]]): Result of ResumeParser.parse_resume for resume_path,
+                if the resume has already been parsed (e.g. in a worker process).
             
         Returns:
             Dict[str, Any]: Comprehensive assessment results
+            
+        Raises:
+            openai.AuthenticationError, requests.HTTPError: If the LLM API rejects the API key.
+                Other errors are recorded in the result instead.
         """
         logger.info(f"Starting resume-job fit assessment")
         logger.info(f"Resume: {resume_path}")
         logger.info(f"Job Profile: {job_profile_path}")
         
-        result = {
-            'success': False,
-            'resume_path': resume_path,
-            'job_profile_path': job_profile_path,
-            'resume_parsing_result': None,
-            'job_profile_content': None,
-            'llm_assessment': None,
-            'error': None
-        }
+        result = self._new_assessment_result(resume_path, job_profile_path)
         
         try:
             # Step 1: Read job profile
-            logger.info("Step 1: Reading job profile description")
-            job_profile = self.read_job_profile(job_profile_path)
+            if job_profile is None:
+                logger.info("Step 1: Reading job profile description")
+                job_profile = self.read_job_profile(job_profile_path)
             result['job_profile_content'] = job_profile
             
-            # Step 2: Parse resume
-            logger.info("Step 2: Parsing resume PDF")
-            resume_result = self.resume_parser.parse_resume(resume_path)
-            result['resume_parsing_result'] = resume_result
-            
-            if not resume_result['success']:
-                raise Exception(f"Resume parsing failed: {resume_result.get('error', 'Unknown error')}")
+            # Steps 2-3: Parse resume and extract its text
+            resume_text = self._extract_resume_text(resume_path, result, resume_result)
             
-            # Step 3: Get combined resume text
-            logger.info("Step 3: Extracting resume text content")
-            resume_text = self.resume_parser.get_combined_text(resume_result)
+            # Step 4: Reuse a cached assessment for identical inputs
+            cache_key = self._assessment_cache_key(job_profile, resume_text)
+            assessment = self._load_cached_assessment(cache_key)
             
-            if not resume_text.strip():
-                raise Exception("No text content extracted from resume")
+            if assessment is None:
+                # Step 5: Create assessment prompt and query LLM
+                logger.info("Step 5: Querying LLM for assessment")
+                prompt = self.create_assessment_prompt(job_profile, resume_text)
+                assessment = self.query_llm(prompt)
+                self._store_cached_assessment(cache_key, assessment)
             
-            # Step 4: Create assessment prompt
-            logger.info("Step 4: Creating assessment prompt")
-            prompt = self.create_assessment_prompt(job_profile, resume_text)
-            
-            # Step 5: Query LLM
-            logger.info("Step 5: Querying llama 3.3 70B for assessment")
-            assessment = self.query_llama33_70b(prompt)
             result['llm_assessment'] = assessment
             
             result['success'] = True
             logger.info("Resume-job fit assessment completed successfully")
             
         except Exception as e:
+            if _is_auth_error(e):
+                # A rejected key fails every assessment, so let the caller stop instead of recording it per resume
+                raise
             logger.error(f"Error during assessment: {str(e)}")
             result['error'] = str(e)
         
         return result
     
+    def _new_assessment_result(self, resume_path: str, job_profile_path: str) -> Dict[str, Any]:
+        """Create an empty assessment result with the standard keys."""
+        return {
+            'success': False,
+            'resume_path': resume_path,
+            'job_profile_path': job_profile_path,
+            'resume_parsing_result': None,
+            'job_profile_content': None,
+            'llm_assessment': None,
+            'error': None
+        }
+    
+    def _extract_resume_text(self, resume_path: str, result: Dict[str, Any],
+                             resume_result: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Parse a resume (unless ``resume_result`` is given) and return its combined text,
+        truncated to ``max_input_tokens``, recording the parsing result on ``result``.
+        
+        Raises:
+            Exception: If the resume cannot be parsed or contains no text
+        """
+        # Step 2: Parse resume
+        if resume_result is None:
+            logger.info("Step 2: Parsing resume PDF")
+            with self._parse_lock:
+                resume_result = self.resume_parser.parse_resume(resume_path, split=False)  # Only the combined text is used
+        result['resume_parsing_result'] = resume_result
+        
+        if not resume_result['success']:
+            raise Exception(f"Resume parsing failed: {resume_result.get('error', 'Unknown error')}")
+        
+        # Step 3: Get combined resume text
+        logger.info("Step 3: Extracting resume text content")
+        resume_text = self.resume_parser.get_combined_text(resume_result)
+        
+        if not resume_text.strip():
+            raise Exception("No text content extracted from resume")
+        
+        if self.max_input_tokens:
+            resume_text = truncate_to_token_budget(resume_text, self.max_input_tokens, self.model_name)
+        
+        return resume_text
+    
+    def _assessment_cache_key(self, job_profile: str, resume_text: str,
+                              prompt_signature: Optional[str] = None) -> Optional[str]:
+        """
+        Compute the cache key for a (model, prompt, job profile, resume text) combination.
+        
+        ``prompt_signature`` defaults to the single-resume prompt's; grouped assessments pass their batcher's.
+        """
+        if self.cache_dir is None:
+            return None
+        
+        hasher = _job_profile_hasher(job_profile, self.model_name, prompt_signature or self._prompt_signature).copy()
+        hasher.update(resume_text.encode('utf-8'))
+        return hasher.hexdigest()
+    
+    def _load_cached_assessment(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a previously cached assessment, or None on a cache miss."""
+        if cache_key is None:
+            return None
+        
+        cache_path = self.cache_dir / f"{cache_key}.json"
+        try:
+            with open(cache_path, 'rb') as f:
+                assessment = _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+            return None
+        
+        logger.info(f"Using cached assessment {cache_key[:12]}, skipping LLM call")
+        return assessment
+    
+    def _store_cached_assessment(self, cache_key: Optional[str], assessment: Dict[str, Any]):
+        """Atomically write an assessment to the cache. Unparseable responses are not cached."""
+        if cache_key is None or 'parsing_error' in assessment:
+            return
+        
+        cache_path = self.cache_dir / f"{cache_key}.json"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(assessment))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {cache_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+    
     def save_assessment_report(self, assessment_result: Dict[str, Any], output_path: str) -> bool:
         """
         Save the assessment results to a formatted report file.
@@ -348,90 +1453,9 @@ Ensure your response is valid JSON and provides actionable insights for the hiri
             bool: True if successful, False otherwise
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("RESUME-JOB PROFILE ASSESSMENT REPORT\n")
-                f.write("=" * 50 + "\n\n")
-                
-                # Basic information
-                f.write("Assessment Details:\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Resume File: {assessment_result['resume_path']}\n")
-                f.write(f"Job Profile File: {assessment_result['job_profile_path']}\n")
-                f.write(f"Assessment Status: {'SUCCESS' if assessment_result['success'] else 'FAILED'}\n\n")
-                
-                if not assessment_result['success']:
-                    f.write(f"Error: {assessment_result.get('error', 'Unknown error')}\n")
-                    return True
-                
-                # LLM Assessment Results
-                llm_assessment = assessment_result.get('llm_assessment', {})
-                
-                if 'overall_score' in llm_assessment and llm_assessment['overall_score'] is not None:
-                    f.write(f"OVERALL MATCH SCORE: {llm_assessment['overall_score']}/10\n")
-                    f.write("=" * 30 + "\n\n")
-                
-                if 'summary' in llm_assessment:
-                    f.write("EXECUTIVE SUMMARY:\n")
-                    f.write("-" * 20 + "\n")
-                    f.write(f"{llm_assessment['summary']}\n\n")
-                
-                # Detailed Analysis
-                if 'detailed_analysis' in llm_assessment:
-                    f.write("DETAILED ANALYSIS:\n")
-                    f.write("-" * 20 + "\n")
-                    analysis = llm_assessment['detailed_analysis']
-                    
-                    for key, value in analysis.items():
-                        f.write(f"{key.replace('_', ' ').title()}: {value}\n\n")
-                
-                # Strengths
-                if 'strengths' in llm_assessment and llm_assessment['strengths']:
-                    f.write("CANDIDATE STRENGTHS:\n")
-                    f.write("-" * 20 + "\n")
-                    for i, strength in enumerate(llm_assessment['strengths'], 1):
-                        f.write(f"{i}. {strength}\n")
-                    f.write("\n")
-                
-                # Gaps and Concerns
-                if 'gaps_and_concerns' in llm_assessment and llm_assessment['gaps_and_concerns']:
-                    f.write("GAPS AND CONCERNS:\n")
-                    f.write("-" * 20 + "\n")
-                    for i, concern in enumerate(llm_assessment['gaps_and_concerns'], 1):
-                        f.write(f"{i}. {concern}\n")
-                    f.write("\n")
-                
-                # Recommendations
-                if 'recommendations' in llm_assessment:
-                    f.write("RECOMMENDATIONS:\n")
-                    f.write("-" * 20 + "\n")
-                    recommendations = llm_assessment['recommendations']
-                    
-                    if 'proceed_with_candidate' in recommendations:
-                        f.write(f"Proceed with Candidate: {recommendations['proceed_with_candidate']}\n")
-                    
-                    if 'additional_information_needed' in recommendations:
-                        f.write(f"Additional Information Needed: {recommendations['additional_information_needed']}\n")
-                    
-                    if 'development_areas' in recommendations and recommendations['development_areas']:
-                        f.write("Development Areas:\n")
-                        for i, area in enumerate(recommendations['development_areas'], 1):
-                            f.write(f"  {i}. {area}\n")
-                    f.write("\n")
-                
-                # Raw response if there was a parsing error
-                if 'raw_response' in llm_assessment:
-                    f.write("RAW LLM RESPONSE:\n")
-                    f.write("-" * 20 + "\n")
-                    f.write(f"{llm_assessment['raw_response']}\n\n")
-                
-                # Resume parsing details
-                if assessment_result.get('resume_parsing_result'):
-                    resume_result = assessment_result['resume_parsing_result']
-                    f.write("RESUME PARSING DETAILS:\n")
-                    f.write("-" * 20 + "\n")
-                    f.write(f"Pages: {resume_result['metadata'].get('page_count', 'Unknown')}\n")
-                    f.write(f"Text Chunks: {len(resume_result['text_content'])}\n")
-                    f.write(f"Tables Found: {len(resume_result['tables'])}\n\n")
+            lines = self._assessment_report_lines(assessment_result)
+            with open(output_path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+                f.writelines(lines)
             
             logger.info(f"Assessment report saved to: {output_path}")
             return True
@@ -440,17 +1464,139 @@ Ensure your response is valid JSON and provides actionable insights for the hiri
             logger.error(f"Error saving assessment report: {str(e)}")
             return False
     
-    def batch_assess_resumes(self, job_profile_path: str, resume_directory: str, output_directory: str = "assessments") -> List[Dict[str, Any]]:
+    def _assessment_report_lines(self, assessment_result: Dict[str, Any]) -> List[str]:
+        """Build the text of an assessment report as a list of lines, written in one call by save_assessment_report."""
+        lines = []
+        lines.append("RESUME-JOB PROFILE ASSESSMENT REPORT\n")
+        lines.append("=" * 50 + "\n\n")
+        
+        # Basic information
+        lines.append("Assessment Details:\n")
+        lines.append("-" * 20 + "\n")
+        lines.append(f"Resume File: {assessment_result['resume_path']}\n")
+        lines.append(f"Job Profile File: {assessment_result['job_profile_path']}\n")
+        lines.append(f"Assessment Status: {'SUCCESS' if assessment_result['success'] else 'FAILED'}\n\n")
+        
+        if not assessment_result['success']:
+            lines.append(f"Error: {assessment_result.get('error', 'Unknown error')}\n")
+            return lines
+        
+        # LLM Assessment Results
+        llm_assessment = assessment_result.get('llm_assessment', {})
+        
+        if 'overall_score' in llm_assessment and llm_assessment['overall_score'] is not None:
+            lines.append(f"OVERALL MATCH SCORE: {llm_assessment['overall_score']}/10\n")
+            lines.append("=" * 30 + "\n\n")
+        
+        if 'model' in llm_assessment:
+            assessed_by = f"Assessed By: {llm_assessment['model']}"
+            if 'screening_model' in llm_assessment:
+                assessed_by += (f" (escalated from {llm_assessment['screening_model']}, "
+                                f"which scored {llm_assessment['screening_score']}/10)")
+            lines.append(assessed_by + "\n\n")
+        
+        if 'summary' in llm_assessment:
+            lines.append("EXECUTIVE SUMMARY:\n")
+            lines.append("-" * 20 + "\n")
+            lines.append(f"{llm_assessment['summary']}\n\n")
+        
+        # Detailed Analysis
+        if 'detailed_analysis' in llm_assessment:
+            lines.append("DETAILED ANALYSIS:\n")
+            lines.append("-" * 20 + "\n")
+            analysis = llm_assessment['detailed_analysis']
+            
+            for key, value in analysis.items():
+                lines.append(f"{key.replace('_', ' ').title()}: {value}\n\n")
+        
+        # Strengths
+        if 'strengths' in llm_assessment and llm_assessment['strengths']:
+            lines.append("CANDIDATE STRENGTHS:\n")
+            lines.append("-" * 20 + "\n")
+            for i, strength in enumerate(llm_assessment['strengths'], 1):
+                lines.append(f"{i}. {strength}\n")
+            lines.append("\n")
+        
+        # Gaps and Concerns
+        if 'gaps_and_concerns' in llm_assessment and llm_assessment['gaps_and_concerns']:
+            lines.append("GAPS AND CONCERNS:\n")
+            lines.append("-" * 20 + "\n")
+            for i, concern in enumerate(llm_assessment['gaps_and_concerns'], 1):
+                lines.append(f"{i}. {concern}\n")
+            lines.append("\n")
+        
+        # Recommendations
+        if 'recommendations' in llm_assessment:
+            lines.append("RECOMMENDATIONS:\n")
+            lines.append("-" * 20 + "\n")
+            recommendations = llm_assessment['recommendations']
+            
+            if 'proceed_with_candidate' in recommendations:
+                lines.append(f"Proceed with Candidate: {recommendations['proceed_with_candidate']}\n")
+            
+            if 'additional_information_needed' in recommendations:
+                lines.append(f"Additional Information Needed: {recommendations['additional_information_needed']}\n")
+            
+            if 'development_areas' in recommendations and recommendations['development_areas']:
+                lines.append("Development Areas:\n")
+                for i, area in enumerate(recommendations['development_areas'], 1):
+                    lines.append(f"  {i}. {area}\n")
+            lines.append("\n")
+        
+        # Raw response if there was a parsing error
+        if 'raw_response' in llm_assessment:
+            lines.append("RAW LLM RESPONSE:\n")
+            lines.append("-" * 20 + "\n")
+            lines.append(f"{llm_assessment['raw_response']}\n\n")
+        
+        # Resume parsing details
+        if assessment_result.get('resume_parsing_result'):
+            resume_result = assessment_result['resume_parsing_result']
+            lines.append("RESUME PARSING DETAILS:\n")
+            lines.append("-" * 20 + "\n")
+            lines.append(f"Pages: {resume_result['metadata'].get('page_count', 'Unknown')}\n")
+            # Unsplit results hold one text entry per page rather than chunks
+            text_label = "Text Chunks" if resume_result.get('split', True) else "Text Pages"
+            lines.append(f"{text_label}: {len(resume_result['text_content'])}\n")
+            lines.append(f"Tables Found: {len(resume_result['tables'])}\n\n")
+        
+        return lines
+    
+    def batch_assess_resumes(self, job_profile_path: str, resume_directory: str, output_directory: str = "assessments",
+                             max_concurrency: int = 10,
+                             pdf_files: Optional[Iterable[Union[str, Path]]] = None,
+                             task_timeout: Optional[float] = None,
+                             parse_workers: Optional[int] = None,
+                             parquet: bool = False,
+                             resumes_per_prompt: int = 1) -> List[Dict[str, Any]]:
         """
         Assess multiple resumes against a single job profile.
         
+        Assessments run concurrently (bounded by ``max_concurrency``) since each
+        one spends most of its time waiting on the LLM API, while PDFs are parsed in a
+        separate pool of worker processes so CPU-bound parsing overlaps the API calls.
+        Each result is appended to
+        ``results.jsonl`` in the output directory as it completes; re-running a batch skips
+        resumes already assessed successfully against the same job profile.
+        
         Args:
             job_profile_path (str): Path to the job profile text file
             resume_directory (str): Directory containing resume PDF files
             output_directory (str): Directory to save assessment reports
+            max_concurrency (int): Maximum number of assessments in flight at once
+            pdf_files (Optional[Iterable]): PDF paths to assess instead of scanning ``resume_directory``.
+                May be a lazy iterator; assessments start as paths are produced.
+            task_timeout (Optional[float]): Seconds after which a single assessment is recorded as failed
+            parse_workers (Optional[int]): Number of PDF parsing processes (default: CPU count).
+                Use 0 to parse in the assessment threads instead.
+            parquet (bool): Write all results of this run to ``results.parquet`` instead of
+                one text report per resume (requires pyarrow)
+            resumes_per_prompt (int): Assess up to this many resumes in one GPT-4o request, sharing
+                the instructions and job profile between them (1 sends one request per resume).
+                Groups are filled from the assessments in flight, so ``max_concurrency`` should be at least as large.
             
         Returns:
-            List[Dict[str, Any]]: List of assessment results
+            List[Dict[str, Any]]: List of assessment results, in the same order as the PDF files
         """
         logger.info(f"Starting batch assessment of resumes in: {resume_directory}")
         
@@ -458,106 +1604,625 @@ Ensure your response is valid JSON and provides actionable insights for the hiri
         output_dir = Path(output_directory)
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Read the job profile once for the whole batch
+        job_profile = self.read_job_profile(job_profile_path)
+        
         # Find all PDF files in the resume directory
-        resume_dir = Path(resume_directory)
-        pdf_files = list(resume_dir.glob("*.pdf")) + list(resume_dir.glob("*.PDF"))
+        if pdf_files is None:
+            pdf_files = self._find_pdf_files(resume_directory)
         
-        if not pdf_files:
+        results_path = output_dir / BATCH_RESULTS_FILENAME
+        completed = self._load_completed_results(results_path, job_profile_path)
+        
+        parquet_sink = ParquetResultSink(output_dir / BATCH_PARQUET_FILENAME) if parquet else None
+        parse_pool = ProcessPoolExecutor(max_workers=parse_workers or os.cpu_count()) if parse_workers != 0 else None
+        try:
+            with open(results_path, 'a', encoding='utf-8') as results_file:
+                results = asyncio.run(
+                    self._assess_batch_async(pdf_files, job_profile_path, job_profile, output_dir,
+                                             max_concurrency, completed, results_file, task_timeout, parse_pool,
+                                             parquet_sink, resumes_per_prompt)
+                )
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+            if parquet_sink is not None:
+                parquet_sink.close()
+        
+        if not results:
             logger.warning(f"No PDF files found in directory: {resume_directory}")
             return []
         
-        logger.info(f"Found {len(pdf_files)} PDF files to assess")
+        # Create summary report
+        self._create_batch_summary_report(results, job_profile_path, output_dir)
         
-        results = []
+        logger.info(f"Batch assessment completed. Results saved to: {output_directory}")
+        return results
+    
+    def _find_pdf_files(self, resume_directory: str) -> List[Path]:
+        """Find all PDF files in the resume directory."""
+        # One scandir pass, matching the extension case-insensitively, so no file is listed twice
+        with os.scandir(resume_directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(".pdf")]
+    
+    def _load_completed_results(self, results_path: Path, job_profile_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load successful records for this job profile from a previous run, keyed by resume path.
+        
+        Resumes the embedding pre-filter rejected are left out, so they are screened again (and reach
+        the LLM if this run's threshold, or no threshold, lets them through).
+        """
+        completed = {
+            record['resume_path']: record
+            for record in iter_batch_results(results_path)
+            if record.get('success') and record.get('job_profile_path') == job_profile_path
+            and 'embedding_similarity' not in (record.get('llm_assessment') or {})
+        }
+        if completed:
+            logger.info(f"Resuming batch: {len(completed)} resume(s) already assessed in {results_path}")
+        return completed
+    
+    def _append_batch_record(self, results_file, result: Dict[str, Any]):
+        """Append one result to the batch results JSONL file and flush it to disk."""
+        results_file.write(_json_dumps(AssessmentRecord.from_result(result).to_dict()).decode('utf-8') + "\n")
+        results_file.flush()
+    
+    async def _assess_batch_async(self, pdf_files: Iterable[Union[str, Path]], job_profile_path: str,
+                                  job_profile: str, output_dir: Path, max_concurrency: int, completed: Dict[str, Dict[str, Any]],
+                                  results_file, task_timeout: Optional[float] = None,
+                                  parse_pool: Optional[ProcessPoolExecutor] = None,
+                                  parquet_sink: Optional[ParquetResultSink] = None,
+                                  resumes_per_prompt: int = 1) -> List[Dict[str, Any]]:
+        """Run assessments concurrently, bounded by a semaphore, handling each one as it completes."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        loop = asyncio.get_running_loop()
+        # GPT-4o requests are awaited natively, so in-flight assessments don't each hold a thread
+        # (the default to_thread pool would otherwise cap concurrency); Together still uses threads.
+        aclient = self._new_async_client() if self.client is not None else None
+        batcher = None
+        if resumes_per_prompt > 1:
+            if aclient is not None:
+                batcher = _PromptBatcher(self, aclient, job_profile, resumes_per_prompt)
+            else:
+                logger.warning("Grouping resumes into one prompt requires GPT-4o; assessing them one per request")
+        gate = (_EmbeddingGate(self, aclient, job_profile)
+                if aclient is not None and self.embedding_threshold is not None else None)
+        auth_error = None  # Set once the API rejects the key; remaining assessments then fail fast
+        seen: Dict[bytes, asyncio.Task] = {}  # Resume text digest -> task assessing its first copy
         
-        for pdf_file in pdf_files:
+        async def parse_one(pdf_file: Path) -> Optional[Dict[str, Any]]:
+            if parse_pool is None:
+                return None
             try:
-                logger.info(f"Assessing: {pdf_file.name}")
-                
-                # Perform assessment
-                result = self.assess_resume_job_fit(str(pdf_file), job_profile_path)
-                results.append(result)
-                
-                # Save individual report
-                report_filename = f"{pdf_file.stem}_assessment.txt"
-                report_path = output_dir / report_filename
-                self.save_assessment_report(result, str(report_path))
-                
-                # Log result
-                if result['success'] and result.get('llm_assessment', {}).get('overall_score') is not None:
-                    score = result['llm_assessment']['overall_score']
-                    logger.info(f"  ✅ Completed - Score: {score}/10")
-                else:
-                    logger.warning(f"  ❌ Failed - {result.get('error', 'Unknown error')}")
-                
+                return await loop.run_in_executor(parse_pool, _parse_resume_in_worker, str(pdf_file),
+                                                  self.parse_cache_dir)
             except Exception as e:
-                logger.error(f"Error assessing {pdf_file.name}: {str(e)}")
-                results.append({
-                    'success': False,
-                    'resume_path': str(pdf_file),
-                    'job_profile_path': job_profile_path,
-                    'error': str(e)
-                })
+                # Fall back to parsing in the assessment thread
+                logger.warning(f"Parsing {pdf_file.name} in a worker process failed, retrying in-process: {str(e)}")
+                return None
+        
+        def failure(pdf_file: Path, error: str) -> Dict[str, Any]:
+            return {
+                'success': False,
+                'resume_path': str(pdf_file),
+                'job_profile_path': job_profile_path,
+                'error': error
+            }
+        
+        async def assess_one(pdf_file: Path) -> Dict[str, Any]:
+            nonlocal auth_error
+            # Parsing runs outside the semaphore so upcoming resumes are parsed while others await the LLM
+            resume_result = await parse_one(pdf_file)
+            
+            # Identical resumes (e.g. the same CV under several filenames) share one LLM call
+            digest = self._resume_text_digest(resume_result)
+            original = seen.get(digest) if digest is not None else None
+            if original is not None:
+                result = await self._copy_duplicate_result(original, pdf_file, resume_result, output_dir,
+                                                           write_report=parquet_sink is None)
+                if result is not None:
+                    return result
+            elif digest is not None:
+                seen[digest] = asyncio.current_task()
+            
+            async with semaphore:
+                if auth_error is not None:
+                    return failure(pdf_file, auth_error)
+                if aclient is not None:
+                    assessment = self._assess_and_report_async(aclient, pdf_file, job_profile_path, job_profile,
+                                                               output_dir, resume_result, parquet_sink is None,
+                                                               batcher, gate)
+                else:
+                    assessment = asyncio.to_thread(self._assess_and_report, pdf_file, job_profile_path, job_profile,
+                                                   output_dir, resume_result, parquet_sink is None)
+                try:
+                    # A timed-out GPT-4o request is cancelled. A timed-out worker thread cannot be interrupted;
+                    # it finishes in the background but its result is discarded and its semaphore slot is released.
+                    return await asyncio.wait_for(assessment, timeout=task_timeout)
+                except asyncio.TimeoutError:
+                    error = f"Assessment timed out after {task_timeout}s"
+                except (openai.AuthenticationError, requests.HTTPError) as e:
+                    error = str(e)
+                    if _is_auth_error(e) and auth_error is None:
+                        auth_error = f"LLM API rejected the API key: {error}"
+                        logger.error(f"{auth_error}; skipping the remaining assessments")
+                except Exception as e:
+                    error = str(e)
+            logger.error(f"Error assessing {pdf_file.name}: {error}")
+            return failure(pdf_file, error)
+        
+        try:
+            # Start each assessment as soon as its path is produced, so work overlaps directory traversal.
+            # Entries hold either a checkpointed record from a previous run or a running task.
+            entries = []
+            for pdf_file in pdf_files:
+                pdf_file = Path(pdf_file)
+                record = completed.get(str(pdf_file))
+                if record is not None:
+                    entries.append(record)
+                    if parquet_sink is not None:
+                        parquet_sink.add(record)
+                    continue
+                entries.append(asyncio.create_task(assess_one(pdf_file)))
+                await asyncio.sleep(0)
+            
+            tasks = [entry for entry in entries if isinstance(entry, asyncio.Task)]
+            if entries:
+                logger.info(f"Found {len(entries)} PDF files, {len(tasks)} to assess (max concurrency: {max_concurrency})")
+            
+            # Report and persist results in completion order so slow outliers don't hold up progress.
+            # This runs on the event loop thread, so JSONL writes never interleave.
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                result = await next_result
+                self._append_batch_record(results_file, result)
+                if parquet_sink is not None:
+                    parquet_sink.add(result)
+                self._log_batch_result(result, f"[{done}/{len(tasks)}] ")
+            
+        finally:
+            if aclient is not None:
+                await aclient.close()
+        
+        return [entry.result() if isinstance(entry, asyncio.Task) else entry for entry in entries]
+    
+    def _resume_text_digest(self, resume_result: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Return a digest of a parsed resume's text for spotting duplicates, or None if it has no text."""
+        if not resume_result or not resume_result.get('success'):
+            return None
+        resume_text = self.resume_parser.get_combined_text(resume_result)
+        if not resume_text.strip():
+            return None
+        return hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest()
+    
+    async def _copy_duplicate_result(self, original: asyncio.Task, pdf_file: Path, resume_result: Dict[str, Any],
+                                     output_dir: Path, write_report: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Reuse the assessment of an identical resume for ``pdf_file``.
+        
+        Returns None if the original assessment failed, so the duplicate is assessed on its own.
+        """
+        first = await original
+        if not first['success']:
+            return None
+        
+        logger.info(f"{pdf_file.name} duplicates {os.path.basename(first['resume_path'])}; reusing its assessment")
+        result = dict(first, resume_path=str(pdf_file), resume_parsing_result=resume_result)
+        if write_report:
+            await asyncio.to_thread(self._report_batch_result, result, pdf_file, output_dir)
+        return result
+    
+    def _assess_and_report(self, pdf_file: Path, job_profile_path: str, job_profile: str,
+                           output_dir: Path, resume_result: Optional[Dict[str, Any]] = None,
+                           write_report: bool = True) -> Dict[str, Any]:
+        """Assess a single resume from a batch and, unless disabled, save its individual report."""
+        logger.info(f"Assessing: {pdf_file.name}")
+        
+        # Perform assessment
+        result = self.assess_resume_job_fit(str(pdf_file), job_profile_path, job_profile=job_profile,
+                                            resume_result=resume_result)
+        if write_report:
+            self._report_batch_result(result, pdf_file, output_dir)
+        return result
+    
+    async def _assess_and_report_async(self, aclient: _ClientPool, pdf_file: Path, job_profile_path: str,
+                                       job_profile: str, output_dir: Path,
+                                       resume_result: Optional[Dict[str, Any]] = None,
+                                       write_report: bool = True,
+                                       batcher: Optional[_PromptBatcher] = None,
+                                       gate: Optional[_EmbeddingGate] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of _assess_and_report for GPT-4o batches.
+        
+        Parsing and file I/O run in threads; the LLM request is awaited on the event loop,
+        grouped with other resumes when a ``batcher`` is given. With a ``gate``, resumes below
+        ``embedding_threshold`` similarity to the job profile are recorded without an LLM request.
+        Like assess_resume_job_fit, auth errors are raised and other errors are recorded in the result.
+        """
+        logger.info(f"Assessing: {pdf_file.name}")
+        
+        result = self._new_assessment_result(str(pdf_file), job_profile_path)
+        result['job_profile_content'] = job_profile
+        
+        try:
+            resume_text = await asyncio.to_thread(self._extract_resume_text, str(pdf_file), result, resume_result)
+            
+            cache_key = self._assessment_cache_key(job_profile, resume_text,
+                                                   batcher.prompt_signature if batcher is not None else None)
+            assessment = await asyncio.to_thread(self._load_cached_assessment, cache_key) if cache_key else None
+            
+            similarity = None
+            if assessment is None and gate is not None:
+                similarity = await gate.similarity(resume_text)
+            
+            if similarity is not None and similarity < self.embedding_threshold:
+                # Not cached: it is no LLM assessment, and another run may use another threshold
+                assessment = self._filtered_assessment(similarity)
+            elif assessment is None:
+                if batcher is not None:
+                    assessment = await batcher.assess(resume_text)
+                else:
+                    prompt = self.create_assessment_prompt(job_profile, resume_text)
+                    assessment = await self.query_gpt4o_async(aclient, prompt)
+                if cache_key:
+                    await asyncio.to_thread(self._store_cached_assessment, cache_key, assessment)
+            
+            result['llm_assessment'] = assessment
+            result['success'] = True
+            
+        except Exception as e:
+            if _is_auth_error(e):
+                raise
+            logger.error(f"Error during assessment: {str(e)}")
+            result['error'] = str(e)
+        
+        if write_report:
+            await asyncio.to_thread(self._report_batch_result, result, pdf_file, output_dir)
+        return result
+    
+    def _filtered_assessment(self, similarity: float) -> Dict[str, Any]:
+        """Build the assessment of a resume the embedding pre-filter kept from the LLM."""
+        return {
+            'overall_score': None,
+            'model': EMBEDDING_MODEL,
+            'embedding_similarity': round(similarity, 4),
+            'summary': (f"Not assessed by the LLM: the resume's embedding similarity to the job profile "
+                        f"({similarity:.2f}) is below the {self.embedding_threshold:.2f} threshold.")
+        }
+    
+    def _report_batch_result(self, result: Dict[str, Any], pdf_file: Path, output_dir: Path):
+        """Save the individual report for a batch result."""
+        report_filename = f"{pdf_file.stem}_assessment.txt"
+        report_path = output_dir / report_filename
+        self.save_assessment_report(result, str(report_path))
+    
+    def _log_batch_result(self, result: Dict[str, Any], progress: str = ""):
+        """Log the outcome of a single batch assessment."""
+        name = os.path.basename(result['resume_path'])
+        if result['success'] and result.get('llm_assessment', {}).get('overall_score') is not None:
+            score = result['llm_assessment']['overall_score']
+            logger.info(f"  {progress}✅ {name} completed - Score: {score}/10")
+        elif result['success'] and 'embedding_similarity' in result.get('llm_assessment', {}):
+            similarity = result['llm_assessment']['embedding_similarity']
+            logger.info(f"  {progress}⏭️ {name} filtered out - Embedding similarity: {similarity:.2f}")
+        else:
+            logger.warning(f"  {progress}❌ {name} failed - {result.get('error', 'Unknown error')}")
+    
+    def batch_assess_resumes_offline(self, job_profile_path: str, resume_directory: str, output_directory: str = "assessments",
+                                     poll_interval: float = 30.0, max_poll_interval: float = 600.0,
+                                     pdf_files: Optional[Iterable[Union[str, Path]]] = None,
+                                     parquet: bool = False,
+                                     parse_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Assess multiple resumes against a single job profile using the OpenAI Batch API.
+        
+        Batch jobs are billed at roughly half the realtime rate but may take up to 24 hours
+        to complete, so this is intended for non-interactive screening runs.
+        
+        Args:
+            job_profile_path (str): Path to the job profile text file
+            resume_directory (str): Directory containing resume PDF files
+            output_directory (str): Directory to save assessment reports and the batch request file
+            poll_interval (float): Initial delay in seconds between batch status checks
+            max_poll_interval (float): Upper bound for the exponentially growing poll delay
+            pdf_files (Optional[Iterable]): PDF paths to assess instead of scanning ``resume_directory``
+            parquet (bool): Write all results of this run to ``results.parquet`` instead of
+                one text report per resume (requires pyarrow)
+            parse_workers (Optional[int]): Number of PDF parsing processes (default: CPU count).
+                Use 0 to parse in-process.
+            
+        Returns:
+            List[Dict[str, Any]]: List of assessment results, in the same order as the PDF files
+            
+        Raises:
+            MissingAPIKeyError: If no OpenAI client is configured
+        """
+        if self.client is None:
+            raise MissingAPIKeyError("The OpenAI Batch API requires the OPENAI_API_KEY environment variable to be set.")
+        if parquet and pa is None:
+            # Fail before submitting a batch whose results could not be written
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+        
+        logger.info(f"Starting offline batch assessment of resumes in: {resume_directory}")
+        
+        output_dir = Path(output_directory)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        if pdf_files is None:
+            pdf_files = self._find_pdf_files(resume_directory)
+        pdf_files = [Path(pdf_file) for pdf_file in pdf_files]
+        
+        if not pdf_files:
+            logger.warning(f"No PDF files found in directory: {resume_directory}")
+            return []
+        
+        job_profile = self.read_job_profile(job_profile_path)
+        
+        results_path = output_dir / BATCH_RESULTS_FILENAME
+        completed = self._load_completed_results(results_path, job_profile_path)
+        
+        results = []
+        new_results = []  # (pdf_file, result) pairs assessed in this run
+        pending = {}  # custom_id -> result awaiting a batch response
+        cache_keys = {}  # custom_id -> assessment cache key
+        submitted = {}  # resume text digest -> custom_id of the first copy sent to the batch
+        duplicates = []  # (result, custom_id) pairs answered by another resume's request
+        requests_path = output_dir / "batch_requests.jsonl"
+        
+        # Parse every resume up front in worker processes; the request file is written in order
+        # as their results arrive, so writing overlaps the remaining parsing
+        parse_pool = ProcessPoolExecutor(max_workers=parse_workers or os.cpu_count()) if parse_workers != 0 else None
+        parses = {}  # PDF path -> future parsing it
+        if parse_pool is not None:
+            for pdf_file in pdf_files:
+                if str(pdf_file) not in completed:
+                    parses[str(pdf_file)] = parse_pool.submit(_parse_resume_in_worker, str(pdf_file),
+                                                              self.parse_cache_dir)
+        
+        # Stream one chat completion request per resume into the batch input file
+        try:
+            with open(requests_path, 'w', encoding='utf-8') as f:
+                for index, pdf_file in enumerate(pdf_files):
+                    if str(pdf_file) in completed:
+                        results.append(completed[str(pdf_file)])
+                        continue
+                    
+                    result = self._new_assessment_result(str(pdf_file), job_profile_path)
+                    result['job_profile_content'] = job_profile
+                    results.append(result)
+                    new_results.append((pdf_file, result))
+                    
+                    resume_result = None
+                    parse = parses.pop(str(pdf_file), None)
+                    if parse is not None:
+                        try:
+                            resume_result = parse.result()
+                        except Exception as e:
+                            # Fall back to parsing in this process
+                            logger.warning(f"Parsing {pdf_file.name} in a worker process failed, retrying in-process: {str(e)}")
+                    
+                    try:
+                        resume_text = self._extract_resume_text(str(pdf_file), result, resume_result)
+                    except Exception as e:
+                        logger.error(f"Error preparing {pdf_file.name}: {str(e)}")
+                        result['error'] = str(e)
+                        continue
+                    
+                    cache_key = self._assessment_cache_key(job_profile, resume_text)
+                    cached = self._load_cached_assessment(cache_key)
+                    if cached is not None:
+                        result['llm_assessment'] = cached
+                        result['success'] = True
+                        continue
+                    
+                    digest = hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest()
+                    if digest in submitted:
+                        duplicates.append((result, submitted[digest]))
+                        continue
+                    
+                    custom_id = pdf_file.stem if pdf_file.stem not in pending else f"{pdf_file.stem}-{index}"
+                    pending[custom_id] = result
+                    cache_keys[custom_id] = cache_key
+                    submitted[digest] = custom_id
+                    prompt = self.create_assessment_prompt(job_profile, resume_text)
+                    f.write(_json_dumps({
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._build_gpt4o_request(prompt)
+                    }).decode('utf-8') + "\n")
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+        
+        if pending:
+            answers = dict(pending)  # custom_id -> result, kept after responses are matched
+            logger.info(f"Submitting {len(pending)} requests to the OpenAI Batch API"
+                        + (f" ({len(duplicates)} duplicate resume(s) will reuse them)" if duplicates else ""))
+            with open(requests_path, 'rb') as f:
+                batch_input = self.client.files.create(file=f, purpose="batch")
+            
+            batch = self.client.batches.create(
+                input_file_id=batch_input.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            batch = self._wait_for_batch(batch.id, poll_interval, max_poll_interval)
+            
+            if batch.status != "completed":
+                logger.error(f"Batch {batch.id} ended with status: {batch.status}")
+            
+            # Successful responses land in the output file and failed requests in the error file;
+            # both use the same record format, and either may be present for a partial batch.
+            for file_id in (batch.output_file_id, getattr(batch, 'error_file_id', None)):
+                if not file_id:
+                    continue
+                output = self.client.files.content(file_id).text
+                for line in output.splitlines():
+                    if line.strip():
+                        record = _json_loads(line)
+                        result = self._apply_batch_output(record, pending)
+                        if result is not None and result['success']:
+                            self._store_cached_assessment(cache_keys[record['custom_id']], result['llm_assessment'])
+            
+            # Anything left was not answered by the batch
+            for result in pending.values():
+                result['error'] = f"No response for this resume in batch {batch.id} (status: {batch.status})"
+            
+            # Fan each answer out to the identical resumes that were not submitted
+            for result, custom_id in duplicates:
+                original = answers[custom_id]
+                result['llm_assessment'] = original['llm_assessment']
+                result['success'] = original['success']
+                result['error'] = original['error']
+        
+        with open(results_path, 'a', encoding='utf-8') as results_file:
+            for pdf_file, result in new_results:
+                if not parquet:
+                    self._report_batch_result(result, pdf_file, output_dir)
+                self._append_batch_record(results_file, result)
+                self._log_batch_result(result)
+        
+        if parquet:
+            with ParquetResultSink(output_dir / BATCH_PARQUET_FILENAME) as parquet_sink:
+                for result in results:
+                    parquet_sink.add(result)
         
-        # Create summary report
         self._create_batch_summary_report(results, job_profile_path, output_dir)
         
-        logger.info(f"Batch assessment completed. Results saved to: {output_directory}")
+        logger.info(f"Offline batch assessment completed. Results saved to: {output_directory}")
         return results
     
+    def _wait_for_batch(self, batch_id: str, poll_interval: float, max_poll_interval: float):
+        """Poll a Batch API job with exponential backoff until it reaches a terminal status."""
+        delay = poll_interval
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                return batch
+            
+            logger.info(f"Batch {batch_id} status: {batch.status}; checking again in {delay:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+    
+    def _apply_batch_output(self, record: Dict[str, Any], pending: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Fill in and return the pending result matching one line of Batch API output."""
+        result = pending.pop(record.get('custom_id'), None)
+        if result is None:
+            logger.warning(f"Ignoring batch output with unknown custom_id: {record.get('custom_id')}")
+            return None
+        
+        response = record.get('response') or {}
+        if record.get('error') or response.get('status_code') != 200:
+            error = record.get('error') or response.get('body', {}).get('error')
+            result['error'] = f"Batch request failed: {error}"
+            return result
+        
+        message = response['body']['choices'][0]['message']
+        content = (message.get('content') or message.get('refusal') or "").strip()
+        result['llm_assessment'] = self._parse_assessment_content(content, "GPT-4o")
+        result['success'] = True
+        return result
+    
     def _create_batch_summary_report(self, results: List[Dict[str, Any]], job_profile_path: str, output_dir: Path):
         """Create a summary report for batch assessment results."""
         try:
             summary_path = output_dir / "batch_assessment_summary.txt"
             
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write("BATCH RESUME ASSESSMENT SUMMARY\n")
-                f.write("=" * 40 + "\n\n")
-                f.write(f"Job Profile: {job_profile_path}\n")
-                f.write(f"Total Resumes Assessed: {len(results)}\n\n")
-                
-                # Sort results by score (if available)
-                scored_results = []
-                failed_results = []
-                
-                for result in results:
-                    if result['success'] and result.get('llm_assessment', {}).get('overall_score') is not None:
-                        scored_results.append(result)
-                    else:
-                        failed_results.append(result)
-                
-                # Sort by score (descending)
-                scored_results.sort(
-                    key=lambda x: x['llm_assessment']['overall_score'], 
-                    reverse=True
-                )
-                
-                f.write("ASSESSMENT RESULTS (RANKED BY SCORE):\n")
-                f.write("-" * 30 + "\n")
-                
-                for i, result in enumerate(scored_results, 1):
-                    score = result['llm_assessment']['overall_score']
-                    resume_name = Path(result['resume_path']).name
-                    f.write(f"{i:2d}. {resume_name:<25} Score: {score}/10\n")
-                
-                if failed_results:
-                    f.write(f"\nFAILED ASSESSMENTS ({len(failed_results)}):\n")
-                    f.write("-" * 20 + "\n")
-                    for result in failed_results:
-                        resume_name = Path(result['resume_path']).name
-                        error = result.get('error', 'Unknown error')
-                        f.write(f"- {resume_name}: {error}\n")
-                
-                # Statistics
-                if scored_results:
-                    scores = [r['llm_assessment']['overall_score'] for r in scored_results]
-                    f.write(f"\nSTATISTICS:\n")
-                    f.write("-" * 15 + "\n")
-                    f.write(f"Average Score: {sum(scores)/len(scores):.1f}\n")
-                    f.write(f"Highest Score: {max(scores)}\n")
-                    f.write(f"Lowest Score: {min(scores)}\n")
-                    f.write(f"Candidates with Score >= 7: {len([s for s in scores if s >= 7])}\n")
-                    f.write(f"Candidates with Score >= 8: {len([s for s in scores if s >= 8])}\n")
+            lines = []
+            lines.append("BATCH RESUME ASSESSMENT SUMMARY\n")
+            lines.append("=" * 40 + "\n\n")
+            lines.append(f"Job Profile: {job_profile_path}\n")
+            lines.append(f"Total Resumes Assessed: {len(results)}\n\n")
+            
+            # Sort results by score (if available)
+            scored_results = []
+            filtered_results = []
+            failed_results = []
+            
+            for result in results:
+                assessment = result.get('llm_assessment') or {}
+                if result['success'] and assessment.get('overall_score') is not None:
+                    scored_results.append(result)
+                elif result['success'] and 'embedding_similarity' in assessment:
+                    filtered_results.append(result)
+                else:
+                    failed_results.append(result)
+            
+            # Sort by score (descending)
+            scored_results.sort(
+                key=lambda x: x['llm_assessment']['overall_score'], 
+                reverse=True
+            )
+            
+            lines.append("ASSESSMENT RESULTS (RANKED BY SCORE):\n")
+            lines.append("-" * 30 + "\n")
+            
+            for i, result in enumerate(scored_results, 1):
+                score = result['llm_assessment']['overall_score']
+                resume_name = os.path.basename(result['resume_path'])
+                lines.append(f"{i:2d}. {resume_name:<25} Score: {score}/10\n")
+            
+            if filtered_results:
+                lines.append(f"\nFILTERED OUT BY EMBEDDING SIMILARITY ({len(filtered_results)}):\n")
+                lines.append("-" * 20 + "\n")
+                for result in filtered_results:
+                    resume_name = os.path.basename(result['resume_path'])
+                    similarity = result['llm_assessment']['embedding_similarity']
+                    lines.append(f"- {resume_name}: similarity {similarity:.2f}\n")
+            
+            if failed_results:
+                lines.append(f"\nFAILED ASSESSMENTS ({len(failed_results)}):\n")
+                lines.append("-" * 20 + "\n")
+                for result in failed_results:
+                    resume_name = os.path.basename(result['resume_path'])
+                    error = result.get('error', 'Unknown error')
+                    lines.append(f"- {resume_name}: {error}\n")
+            
+            # Statistics
+            statistics = None
+            if scored_results:
+                # Already sorted by score, so the extremes are the ends of the list
+                scores = [r['llm_assessment']['overall_score'] for r in scored_results]
+                statistics = {
+                    'average_score': round(sum(scores) / len(scores), 1),
+                    'highest_score': scores[0],
+                    'lowest_score': scores[-1],
+                    'score_at_least_7': sum(1 for s in scores if s >= 7),
+                    'score_at_least_8': sum(1 for s in scores if s >= 8)
+                }
+                lines.append(f"\nSTATISTICS:\n")
+                lines.append("-" * 15 + "\n")
+                lines.append(f"Average Score: {statistics['average_score']:.1f}\n")
+                lines.append(f"Highest Score: {statistics['highest_score']}\n")
+                lines.append(f"Lowest Score: {statistics['lowest_score']}\n")
+                lines.append(f"Candidates with Score >= 7: {statistics['score_at_least_7']}\n")
+                lines.append(f"Candidates with Score >= 8: {statistics['score_at_least_8']}\n")
+            
+            with open(summary_path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+                f.writelines(lines)
+            
+            # Same summary in machine-readable form, so dashboards need not parse the text
+            summary = {
+                'job_profile_path': job_profile_path,
+                'total_resumes': len(results),
+                'ranking': [
+                    {'filename': os.path.basename(r['resume_path']), 'score': r['llm_assessment']['overall_score']}
+                    for r in scored_results
+                ],
+                'filtered': [
+                    {'filename': os.path.basename(r['resume_path']),
+                     'embedding_similarity': r['llm_assessment']['embedding_similarity']}
+                    for r in filtered_results
+                ],
+                'failed': [
+                    {'filename': os.path.basename(r['resume_path']), 'error': r.get('error', 'Unknown error')}
+                    for r in failed_results
+                ],
+                'statistics': statistics
+            }
+            with open(output_dir / BATCH_SUMMARY_JSON_FILENAME, 'wb') as f:
+                f.write(_json_dumps(summary, indent=True))
             
             logger.info(f"Batch summary report saved to: {summary_path}")
             
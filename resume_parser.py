@@ -1,42 +1,129 @@
 import os
+import atexit
+import functools
+import hashlib
 import logging
-import traceback
-from typing import Dict, List, Optional, Any
+import logging.handlers
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Iterable, Iterator
 from pathlib import Path
 
-import pandas as pd
-import pdfplumber
-import fitz  # PyMuPDF
-from langchain_community.document_loaders import PyPDFLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
+# pandas, PyMuPDF and LangChain take about a second to import, so they are imported where
+# they are first used: constructing a parser (e.g. in a fresh worker process) or rejecting an invalid
+# file stays cheap
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+    import pandas as pd
+    from langchain.schema import Document
+
+try:
+    import tiktoken  # Optional: token-sized text chunks
+except ImportError:
+    tiktoken = None
+
+# Configure logging: records go through a queue to a background listener thread that writes them
+# to the log file and stderr, so logging calls never wait on file I/O
+if not logging.root.handlers:
+    _log_handlers = [logging.FileHandler('resume_parser.log'), logging.StreamHandler()]
+    for _handler in _log_handlers:
+        _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    logging.root.addHandler(_queue_handler)
+    logging.root.setLevel(logging.INFO)
+    
+    _log_listener = logging.handlers.QueueListener(_queue_handler.queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    def _log_directly_in_child():
+        """
+        Make a forked process (e.g. a parse worker) write its records straight to the handlers.
+        
+        The listener thread does not survive the fork, and pool workers exit through os._exit
+        without running atexit, so a per-child listener could drop the last records still queued.
+        """
+        logging.root.removeHandler(_queue_handler)
+        for handler in _log_handlers:
+            logging.root.addHandler(handler)
+    
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=_log_directly_in_child)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('resume_parser.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Resumes handed to each parse_resumes worker process at a time
+PARSE_CHUNKSIZE = 4
+
+# Text chunk sizing, in tokens: chunks under the minimum (typically a page's tail) are folded into
+# the preceding chunk of the same page, as long as the result stays within the maximum
+CHUNK_ENCODING = "cl100k_base"
+CHUNK_SIZE_TOKENS = 500
+CHUNK_OVERLAP_TOKENS = 50
+MIN_CHUNK_TOKENS = 100
+MAX_CHUNK_TOKENS = 600
+
+# Rough characters-per-token ratio used for chunk sizes when tiktoken is not available
+CHARS_PER_TOKEN = 4
+
+# Write buffer for saved parsing results, which are streamed part by part
+RESULTS_BUFFER_SIZE = 1 << 16
+
+# Version of parse_resume's output; bump it whenever parsing changes, invalidating cached results
+PARSER_CACHE_VERSION = 3
+
 
 class ResumeParser:
     """
     A comprehensive PDF resume parser using LangChain with table extraction capabilities.
     """
     
-    def __init__(self):
-        """Initialize the resume parser."""
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len
-        )
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the resume parser.
+        
+        Args:
+            cache_dir (Optional[str]): Directory for caching parsing results on disk, keyed by a hash of
+                the PDF's contents and the parser version. Caching is disabled if not provided.
+                Entries are pickles, so only point this at a directory you trust.
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info("ResumeParser initialized successfully")
     
+    @functools.cached_property
+    def text_splitter(self):
+        """LangChain splitter for the extracted text, built on first use."""
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        
+        return RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE_TOKENS,
+            chunk_overlap=CHUNK_OVERLAP_TOKENS,
+            length_function=self._count_tokens,
+            add_start_index=True
+        )
+    
+    @functools.cached_property
+    def _encoding(self):
+        """tiktoken encoding for chunk sizes, or None to approximate them."""
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.get_encoding(CHUNK_ENCODING)
+        except Exception as e:
+            logger.warning(f"Could not load the {CHUNK_ENCODING} tokenizer, approximating chunk token counts: {str(e)}")
+            return None
+    
+    def _count_tokens(self, text: str) -> int:
+        """Token count of text, approximated as ``CHARS_PER_TOKEN`` characters per token without tiktoken."""
+        if self._encoding is None:
+            return len(text) // CHARS_PER_TOKEN
+        return len(self._encoding.encode(text, disallowed_special=()))
+    
     def validate_file(self, file_path: str) -> bool:
         """
         Validate if the file exists and is a PDF.
@@ -48,17 +135,18 @@ class ResumeParser:
             bool: True if file is valid, False otherwise
         """
         try:
-            path = Path(file_path)
-            
-            if not path.exists():
+            # A single stat covers both the existence and the size check
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(f"File does not exist: {file_path}")
                 return False
             
-            if not path.suffix.lower() == '.pdf':
+            if not str(file_path).lower().endswith('.pdf'):
                 logger.error(f"File is not a PDF: {file_path}")
                 return False
             
-            if path.stat().st_size == 0:
+            if file_stat.st_size == 0:
                 logger.error(f"File is empty: {file_path}")
                 return False
             
@@ -69,36 +157,143 @@ class ResumeParser:
             logger.error(f"Error validating file {file_path}: {str(e)}")
             return False
     
-    def extract_text_with_langchain(self, file_path: str) -> List[Document]:
+    def extract_text_with_pymupdf(self, file_path: str, split: bool = True) -> List["Document"]:
         """
-        Extract text from PDF using LangChain's PyPDFLoader.
+        Extract text from PDF using PyMuPDF, split into LangChain Document chunks.
+        
+        MuPDF's C engine extracts text much faster than the pure-Python pypdf used by
+        PyPDFLoader, and the resulting Documents carry the same 'source'/'page' metadata.
         
         Args:
             file_path (str): Path to the PDF file
+            split (bool): Split the pages into chunks; without splitting, one Document is returned per page
             
         Returns:
             List[Document]: List of LangChain Document objects
         """
+        import fitz  # PyMuPDF
+        
         try:
-            logger.info(f"Extracting text using LangChain from: {file_path}")
-            
-            loader = PyPDFLoader(file_path)
-            documents = loader.load()
+            with fitz.open(file_path) as doc:
+                return self._extract_text_from_doc(doc, file_path, split)
+        except Exception as e:
+            logger.error(f"Error extracting text with PyMuPDF: {str(e)}", exc_info=True)
+            return []
+    
+    def _extract_text_from_doc(self, doc: "fitz.Document", file_path: str, split: bool = True) -> List["Document"]:
+        """
+        Extract and split the text of an open PDF (see extract_text_with_pymupdf).
+        
+        Errors propagate, so parse_resume reports (and does not cache) a resume whose text could not be read.
+        """
+        from langchain.schema import Document
+        
+        logger.info(f"Extracting text using PyMuPDF from: {file_path}")
+        
+        documents = [
+            Document(page_content=page.get_text("text"), metadata={'source': file_path, 'page': page_index})
+            for page_index, page in enumerate(doc)
+        ]
+        
+        if not split:
+            logger.info(f"Successfully extracted {len(documents)} page(s) of text")
+            return documents
+        
+        # Split documents into chunks
+        split_docs = self._merge_small_chunks(self.text_splitter.split_documents(documents), documents)
+        
+        logger.info(f"Successfully extracted {len(split_docs)} document chunks")
+        return split_docs
+    
+    def _merge_small_chunks(self, chunks: List["Document"], pages: List["Document"]) -> List["Document"]:
+        """
+        Fold chunks shorter than MIN_CHUNK_TOKENS into the preceding chunk of the same page.
+        
+        The merged chunk is cut from the page text between the two chunks' start offsets, so
+        the overlap they share is not repeated.
+        """
+        from langchain.schema import Document
+        
+        merged = []
+        
+        for chunk in chunks:
+            previous = merged[-1] if merged else None
+            if (previous is not None
+                    and previous.metadata['page'] == chunk.metadata['page']
+                    and previous.metadata.get('start_index', -1) >= 0
+                    and chunk.metadata.get('start_index', -1) >= 0
+                    and self._count_tokens(chunk.page_content) < MIN_CHUNK_TOKENS):
+                page_text = pages[chunk.metadata['page']].page_content
+                content = page_text[previous.metadata['start_index']:
+                                    chunk.metadata['start_index'] + len(chunk.page_content)]
+                if self._count_tokens(content) <= MAX_CHUNK_TOKENS:
+                    merged[-1] = Document(page_content=content, metadata=previous.metadata)
+                    continue
             
-            # Split documents into chunks
-            split_docs = self.text_splitter.split_documents(documents)
+            merged.append(chunk)
+        
+        return merged
+    
+    @staticmethod
+    def _clean_table_rows(table: List[List[Any]]) -> List[List[str]]:
+        """Return a table's rows as strings, with missing cells as '' and data rows padded to the header width."""
+        width = len(table[0])
+        return [['' if cell is None else str(cell) for cell in table[0]]] + [
+            ['' if cell is None else str(cell) for cell in row] + [''] * (width - len(row))
+            for row in table[1:]
+        ]
+    
+    def _build_table_data(self, page_num: int, table_num: int, table: List[List[Any]]) -> Dict[str, Any]:
+        """
+        Convert one extracted table (a list of rows) into the parser's table dict.
+        
+        Only the raw rows and their text are kept; table_to_dataframe builds a DataFrame on demand,
+        so parsing does not hold a third copy of every table (or need pandas at all).
+        """
+        try:
+            return {
+                'page': page_num,
+                'table_number': table_num,
+                'raw_table': table,
+                # Tab-separated rows: the tables are read as LLM context, so cells are not padded into columns
+                'text_representation': "\n".join("\t".join(row) for row in self._clean_table_rows(table))
+            }
             
-            logger.info(f"Successfully extracted {len(split_docs)} document chunks")
-            return split_docs
+        except Exception as table_error:
+            logger.warning(f"Error processing table {table_num} on page {page_num}: {str(table_error)}")
+            # Fallback: store raw table data
+            return {
+                'page': page_num,
+                'table_number': table_num,
+                'raw_table': table,
+                'text_representation': str(table)
+            }
+    
+    def table_to_dataframe(self, table: Dict[str, Any]) -> Optional["pd.DataFrame"]:
+        """
+        Build a pandas DataFrame from a table returned by parse_resume.
+        
+        Args:
+            table (Dict): One entry of the parsing result's ``tables``
             
+        Returns:
+            Optional[pd.DataFrame]: The table with its first row as the columns and missing cells as '',
+                or None if its rows do not fit the header
+        """
+        import pandas as pd
+        
+        raw_table = table['raw_table']
+        try:
+            return pd.DataFrame(self._clean_table_rows(raw_table)[1:], columns=raw_table[0])
         except Exception as e:
-            logger.error(f"Error extracting text with LangChain: {str(e)}")
-            logger.error(traceback.format_exc())
-            return []
+            logger.warning(f"Error converting table {table['table_number']} on page {table['page']}: {str(e)}")
+            return None
     
-    def extract_tables_with_pdfplumber(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_tables_with_pymupdf(self, file_path: str) -> List[Dict[str, Any]]:
         """
-        Extract tables from PDF using pdfplumber.
+        Extract tables from PDF using PyMuPDF's table finder.
+        
+        The table finder runs in MuPDF's C engine and needs PyMuPDF 1.23 or later.
         
         Args:
             file_path (str): Path to the PDF file
@@ -106,53 +301,43 @@ class ResumeParser:
         Returns:
             List[Dict]: List of extracted tables with metadata
         """
+        import fitz  # PyMuPDF
+        
+        try:
+            with fitz.open(file_path) as doc:
+                return self._extract_tables_from_doc(doc, file_path)
+        except Exception as e:
+            logger.error(f"Error opening PDF {file_path}: {str(e)}")
+            return []
+    
+    def _extract_tables_from_doc(self, doc: "fitz.Document", file_path: str) -> List[Dict[str, Any]]:
+        """Extract the tables of an open PDF (see extract_tables_with_pymupdf)."""
         tables_data = []
         
         try:
-            logger.info(f"Extracting tables using pdfplumber from: {file_path}")
+            logger.info(f"Extracting tables using PyMuPDF from: {file_path}")
             
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    tables = page.extract_tables()
+            for page_num, page in enumerate(doc, 1):
+                # The default "lines" strategy builds tables from ruling lines and boxes, so pages
+                # without vector graphics (most resume pages) are skipped before the costly search
+                if not page.get_cdrawings():
+                    continue
+                
+                tables = page.find_tables().tables
+                
+                if tables:
+                    logger.info(f"Found {len(tables)} table(s) on page {page_num}")
                     
-                    if tables:
-                        logger.info(f"Found {len(tables)} table(s) on page {page_num}")
-                        
-                        for table_num, table in enumerate(tables, 1):
-                            if table and len(table) > 0:
-                                # Convert table to DataFrame for better handling
-                                try:
-                                    df = pd.DataFrame(table[1:], columns=table[0])
-                                    # Clean the DataFrame
-                                    df = df.fillna('').astype(str)
-                                    
-                                    table_data = {
-                                        'page': page_num,
-                                        'table_number': table_num,
-                                        'raw_table': table,
-                                        'dataframe': df,
-                                        'text_representation': df.to_string(index=False)
-                                    }
-                                    tables_data.append(table_data)
-                                    
-                                except Exception as table_error:
-                                    logger.warning(f"Error processing table {table_num} on page {page_num}: {str(table_error)}")
-                                    # Fallback: store raw table data
-                                    table_data = {
-                                        'page': page_num,
-                                        'table_number': table_num,
-                                        'raw_table': table,
-                                        'dataframe': None,
-                                        'text_representation': str(table)
-                                    }
-                                    tables_data.append(table_data)
+                    for table_num, found_table in enumerate(tables, 1):
+                        table = found_table.extract()
+                        if table and len(table) > 0:
+                            tables_data.append(self._build_table_data(page_num, table_num, table))
             
             logger.info(f"Successfully extracted {len(tables_data)} table(s)")
             return tables_data
             
         except Exception as e:
-            logger.error(f"Error extracting tables with pdfplumber: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"Error extracting tables with PyMuPDF: {str(e)}", exc_info=True)
             return []
     
     def extract_metadata_with_pymupdf(self, file_path: str) -> Dict[str, Any]:
@@ -165,10 +350,20 @@ class ResumeParser:
         Returns:
             Dict: PDF metadata
         """
+        import fitz  # PyMuPDF
+        
+        try:
+            with fitz.open(file_path) as doc:
+                return self._extract_metadata_from_doc(doc, file_path)
+        except Exception as e:
+            logger.error(f"Error opening PDF {file_path}: {str(e)}")
+            return {}
+    
+    def _extract_metadata_from_doc(self, doc: "fitz.Document", file_path: str) -> Dict[str, Any]:
+        """Extract the metadata of an open PDF (see extract_metadata_with_pymupdf)."""
         try:
             logger.info(f"Extracting metadata using PyMuPDF from: {file_path}")
             
-            doc = fitz.open(file_path)
             metadata = doc.metadata
             
             # Add additional information
@@ -177,22 +372,23 @@ class ResumeParser:
                 'file_size': os.path.getsize(file_path),
                 'file_path': file_path
             })
-            
-            doc.close()
+
             logger.info("Successfully extracted metadata")
             return metadata
             
         except Exception as e:
-            logger.error(f"Error extracting metadata: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"Error extracting metadata: {str(e)}", exc_info=True)
             return {}
     
-    def parse_resume(self, file_path: str) -> Dict[str, Any]:
+    def parse_resume(self, file_path: str, split: bool = True) -> Dict[str, Any]:
         """
         Complete resume parsing pipeline.
         
         Args:
             file_path (str): Path to the PDF file
+            split (bool): Split the text into chunks. Callers that only use the combined text
+                (get_combined_text, save_results_to_file) can pass False to get one entry per page
+                and skip the splitter.
             
         Returns:
             Dict: Comprehensive parsing results
@@ -207,71 +403,203 @@ class ResumeParser:
                 'file_path': file_path
             }
         
+        cache_key = self._parse_cache_key(file_path, split)
+        cached_result = self._load_cached_result(cache_key, file_path)
+        if cached_result is not None:
+            return cached_result
+        
         result = {
             'success': True,
             'file_path': file_path,
+            'split': split,
             'text_content': [],
             'tables': [],
             'metadata': {},
             'error': None
         }
         
+        import fitz  # PyMuPDF
+        
         try:
-            # Extract text using LangChain
-            documents = self.extract_text_with_langchain(file_path)
-            result['text_content'] = [
-                {
-                    'page': doc.metadata.get('page', 'unknown'),
-                    'content': doc.page_content,
-                    'source': doc.metadata.get('source', file_path)
-                }
-                for doc in documents
-            ]
-            
-            # Extract tables
-            tables = self.extract_tables_with_pdfplumber(file_path)
-            result['tables'] = tables
-            
-            # Extract metadata
-            metadata = self.extract_metadata_with_pymupdf(file_path)
-            result['metadata'] = metadata
+            # Open the PDF once for all three passes; every open re-parses the xref table and fonts
+            with fitz.open(file_path) as pdf:
+                # Extract text using PyMuPDF
+                documents = self._extract_text_from_doc(pdf, file_path, split)
+                result['text_content'] = [
+                    {
+                        'page': doc.metadata.get('page', 'unknown'),
+                        'content': doc.page_content,
+                        'source': doc.metadata.get('source', file_path)
+                    }
+                    for doc in documents
+                ]
+                
+                # Extract tables
+                tables = self._extract_tables_from_doc(pdf, file_path)
+                result['tables'] = tables
+                
+                # Extract metadata
+                metadata = self._extract_metadata_from_doc(pdf, file_path)
+                result['metadata'] = metadata
             
             logger.info(f"Successfully completed parsing for: {file_path}")
+            # A result without text (e.g. a scanned PDF) is cheap to recompute and not worth pinning in the cache
+            if result['text_content']:
+                self._store_cached_result(cache_key, result)
             
         except Exception as e:
-            logger.error(f"Error during parsing: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"Error during parsing: {str(e)}", exc_info=True)
             result['success'] = False
             result['error'] = str(e)
         
         return result
     
-    def get_combined_text(self, parsing_result: Dict[str, Any]) -> str:
+    def _parse_cache_key(self, file_path: str, split: bool) -> Optional[str]:
+        """Compute the cache key for a PDF's contents, the parser version and the chunking mode."""
+        if self.cache_dir is None:
+            return None
+        
+        try:
+            hasher = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(block)
+            content_digest = hasher.hexdigest()
+        except OSError as e:
+            logger.warning(f"Could not hash {file_path} for the parse cache: {str(e)}")
+            return None
+        
+        # Chunks differ with and without tiktoken, so the token counting mode is part of the key
+        mode = ('tokens' if self._encoding is not None else 'chars') if split else 'pages'
+        return f"{content_digest}-v{PARSER_CACHE_VERSION}-{mode}"
+    
+    def _load_cached_result(self, cache_key: Optional[str], file_path: str) -> Optional[Dict[str, Any]]:
+        """Return a previously cached parsing result for file_path, or None on a cache miss."""
+        if cache_key is None:
+            return None
+        
+        cache_path = self.cache_dir / f"{cache_key}.pkl"
+        try:
+            with open(cache_path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+            return None
+        
+        # The same contents may have been cached under another path
+        result['file_path'] = file_path
+        if result['metadata']:
+            result['metadata']['file_path'] = file_path
+        for text_chunk in result['text_content']:
+            text_chunk['source'] = file_path
+        
+        logger.info(f"Using cached parsing result {cache_key[:12]} for: {file_path}")
+        return result
+    
+    def _store_cached_result(self, cache_key: Optional[str], result: Dict[str, Any]):
+        """Atomically write a successful parsing result to the cache."""
+        if cache_key is None:
+            return
+        
+        cache_path = self.cache_dir / f"{cache_key}.pkl"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {cache_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def parse_resumes(self, file_paths: Iterable[str], workers: Optional[int] = None,
+                      split: bool = True) -> List[Dict[str, Any]]:
         """
-        Combine all extracted text including tables into a single string.
+        Parse several resumes in parallel worker processes.
+        
+        Each PDF is parsed independently and the parsing is CPU-bound, so separate processes
+        (each with its own ResumeParser) keep all cores busy where threads would not.
         
         Args:
-            parsing_result (Dict): Result from parse_resume method
+            file_paths (Iterable[str]): Paths to the PDF files
+            workers (Optional[int]): Number of worker processes; defaults to one less than the CPU count.
+                With 1, or a single file, resumes are parsed in this process.
+            split (bool): Split the text into chunks (see parse_resume)
             
         Returns:
-            str: Combined text content
+            List[Dict]: parse_resume results in the order of ``file_paths``, each with the
+                time its parse took in ``parse_time_ms``
         """
-        if not parsing_result.get('success', False):
-            return ""
+        file_paths = [str(file_path) for file_path in file_paths]
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        workers = min(workers, len(file_paths))
         
-        combined_text = []
+        started = time.perf_counter()
+        if workers <= 1:
+            results = [_timed_parse(self, file_path, split) for file_path in file_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(functools.partial(_parse_one, split=split, cache_dir=self.cache_dir),
+                                            file_paths, chunksize=PARSE_CHUNKSIZE))
+        
+        succeeded = sum(1 for result in results if result['success'])
+        logger.info(f"Parsed {succeeded}/{len(results)} resume(s) in {time.perf_counter() - started:.1f}s "
+                    f"using {max(workers, 1)} process(es)")
+        return results
+    
+    def iter_combined_text(self, parsing_result: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the parts of the combined text (text chunks, then tables) one at a time.
+        
+        Joined with newlines, the parts form ``get_combined_text``'s result; iterating them
+        lets callers write the text out without building it in memory first.
+        
+        Args:
+            parsing_result (Dict): Result from parse_resume method
+            
+        Yields:
+            str: The next text chunk or table line
+        """
+        if not parsing_result.get('success', False):
+            return
         
         # Add regular text content
         for text_chunk in parsing_result.get('text_content', []):
-            combined_text.append(text_chunk['content'])
+            yield text_chunk['content']
         
         # Add table content
         for table in parsing_result.get('tables', []):
-            combined_text.append(f"\n--- Table from Page {table['page']} ---")
-            combined_text.append(table['text_representation'])
-            combined_text.append("--- End Table ---\n")
+            yield f"\n--- Table from Page {table['page']} ---"
+            yield table['text_representation']
+            yield "--- End Table ---\n"
+    
+    def get_combined_text(self, parsing_result: Dict[str, Any], max_chars: Optional[int] = None) -> str:
+        """
+        Combine all extracted text including tables into a single string.
         
-        return "\n".join(combined_text)
+        Args:
+            parsing_result (Dict): Result from parse_resume method
+            max_chars (Optional[int]): Return at most this many characters, stopping as soon
+                as enough text has been collected (e.g. for a preview)
+            
+        Returns:
+            str: Combined text content
+        """
+        if max_chars is None:
+            return "\n".join(self.iter_combined_text(parsing_result))
+        
+        combined_text = []
+        total_chars = -1  # Length of "\n".join(combined_text): each part adds itself plus one separator
+        
+        for part in self.iter_combined_text(parsing_result):
+            combined_text.append(part)
+            total_chars += len(part) + 1
+            if total_chars >= max_chars:
+                break
+        
+        return "\n".join(combined_text)[:max_chars]
     
     def save_results_to_file(self, parsing_result: Dict[str, Any], output_path: str) -> bool:
         """
@@ -285,9 +613,7 @@ class ResumeParser:
             bool: True if successful, False otherwise
         """
         try:
-            combined_text = self.get_combined_text(parsing_result)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8', buffering=RESULTS_BUFFER_SIZE) as f:
                 f.write(f"Resume Parsing Results\n")
                 f.write(f"=" * 50 + "\n\n")
                 f.write(f"Source File: {parsing_result['file_path']}\n")
@@ -302,7 +628,11 @@ class ResumeParser:
                 
                 f.write("Extracted Content:\n")
                 f.write("-" * 20 + "\n")
-                f.write(combined_text)
+                # Stream the combined text part by part instead of joining it into one string first
+                for part_num, part in enumerate(self.iter_combined_text(parsing_result)):
+                    if part_num:
+                        f.write("\n")
+                    f.write(part)
             
             logger.info(f"Results saved to: {output_path}")
             return True
@@ -312,6 +642,26 @@ class ResumeParser:
             return False
 
 
+def _timed_parse(parser: ResumeParser, file_path: str, split: bool = True) -> Dict[str, Any]:
+    """Parse a resume, recording how long it took in the result's ``parse_time_ms``."""
+    started = time.perf_counter()
+    result = parser.parse_resume(file_path, split)
+    result['parse_time_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+# ResumeParser owned by a parse_resumes worker process, created on its first resume
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _parse_one(file_path: str, split: bool = True, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Parse a resume inside a parse_resumes worker process, reusing one ResumeParser per process."""
+    global _worker_parser
+    if _worker_parser is None or _worker_parser.cache_dir != cache_dir:
+        _worker_parser = ResumeParser(cache_dir)
+    return _timed_parse(_worker_parser, file_path, split)
+
+
 def main():
     """Example usage of the ResumeParser."""
     parser = ResumeParser()
@@ -77,6 +77,7 @@ python example_usage.py resume1.pdf resume2.pdf
 
 # Run tests
 python test_parser.py
+python test_matcher.py
 ```
 
 ## Troubleshooting
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Test script for the Resume Job Matcher
+This script checks the matcher's retry, endpoint failover and batch checkpoint
+logic offline, using stub API clients in place of the LLM APIs.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import traceback
+import types
+from pathlib import Path
+
+
+class StubAsyncClient:
+    """Stand-in for openai.AsyncOpenAI that counts chat requests and raises queued errors."""
+    
+    def __init__(self, name, errors=()):
+        self.name = name
+        self.calls = 0
+        self.errors = list(errors)
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+    
+    async def _create(self, **request):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.name
+
+
+def rate_limit_error(retry_after="30"):
+    """Build the openai.RateLimitError a 429 response raises."""
+    import httpx
+    import openai
+    
+    request = httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+def new_matcher(**kwargs):
+    """Create an OpenAI matcher with a dummy API key (no request is sent to a real API)."""
+    from resume_job_matcher import ResumeJobMatcher
+    
+    # The matcher picks the OpenAI clients when OPENAI_API_KEY is set
+    saved_key = os.environ.get("OPENAI_API_KEY")
+    os.environ["OPENAI_API_KEY"] = "sk-test"
+    try:
+        return ResumeJobMatcher(api_key="sk-test", **kwargs)
+    finally:
+        if saved_key is None:
+            del os.environ["OPENAI_API_KEY"]
+        else:
+            os.environ["OPENAI_API_KEY"] = saved_key
+
+
+def test_sdk_retries_disabled():
+    """Test that the OpenAI clients leave retries to the matcher's own retry layer."""
+    print("\nTesting OpenAI client retry settings...")
+    
+    try:
+        matcher = new_matcher(endpoints=[("sk-second", "https://second.example.com/v1")])
+        
+        async def check():
+            pool = matcher._new_async_client()
+            try:
+                return [client.max_retries for client in pool.clients]
+            finally:
+                await pool.close()
+        
+        max_retries = [matcher.client.max_retries] + asyncio.run(check())
+        if max_retries != [0, 0, 0]:
+            print(f"❌ Expected SDK max_retries of 0 on every endpoint, got {max_retries}")
+            return False
+        
+        print("✅ SDK retries are disabled on the sync client and every endpoint's async client")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Client retry settings test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_rate_limited_endpoint_failover():
+    """Test that a rate limited endpoint is cooled down and requests move to the other endpoint."""
+    print("\nTesting endpoint failover on rate limits...")
+    
+    try:
+        import httpx
+        from resume_job_matcher import _ClientPool
+        
+        matcher = new_matcher()
+        first = StubAsyncClient("first", errors=[rate_limit_error()])
+        second = StubAsyncClient("second")
+        request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Assess this resume"}]}
+        
+        async def run():
+            pool = _ClientPool([(first, None), (second, None)], httpx.AsyncClient())
+            try:
+                response = await matcher._with_retries_async(pool, lambda: pool.create(request, 10), "gpt-4o")
+                next_response = await pool.create(request, 10)
+                return response, next_response
+            finally:
+                await pool.close()
+        
+        response, next_response = asyncio.run(run())
+        
+        if (first.calls, second.calls) != (1, 2):
+            print(f"❌ Expected 1 request to the rate limited endpoint and 2 to the other, "
+                  f"got {first.calls} and {second.calls}")
+            return False
+        if (response, next_response) != ("second", "second"):
+            print(f"❌ Expected both responses from the second endpoint, got {response!r} and {next_response!r}")
+            return False
+        
+        print("✅ Rate limited request retried on the other endpoint, which also took the next request")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Endpoint failover test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_retry_counts():
+    """Test that transient errors are retried up to max_retries times and other errors are not retried."""
+    print("\nTesting LLM request retries...")
+    
+    try:
+        import requests
+        import resume_job_matcher
+        
+        matcher = new_matcher()
+        
+        def failing_query(errors):
+            calls = []
+            
+            def query():
+                calls.append(None)
+                if errors:
+                    raise errors.pop(0)
+                return "response"
+            return query, calls
+        
+        saved_delay = resume_job_matcher._retry_delay
+        resume_job_matcher._retry_delay = lambda attempt: 0
+        try:
+            checks = []
+            
+            # Succeeding on the third attempt takes three calls
+            query, calls = failing_query([requests.ConnectionError(), rate_limit_error()])
+            response = matcher._with_retries(query, max_retries=3)
+            checks.append(("two transient errors", (len(calls), response), (3, "response")))
+            
+            # A request that keeps failing is tried max_retries + 1 times before the error is raised
+            query, calls = failing_query([requests.Timeout() for _ in range(10)])
+            try:
+                matcher._with_retries(query, max_retries=3)
+                raised = False
+            except requests.Timeout:
+                raised = True
+            checks.append(("persistent transient errors", (len(calls), raised), (4, True)))
+            
+            # A non-retryable error is raised after one call
+            query, calls = failing_query([ValueError("bad request"), ValueError("bad request")])
+            try:
+                matcher._with_retries(query, max_retries=3)
+                raised = False
+            except ValueError:
+                raised = True
+            checks.append(("non-retryable error", (len(calls), raised), (1, True)))
+        finally:
+            resume_job_matcher._retry_delay = saved_delay
+        
+        failed = [(name, got, expected) for name, got, expected in checks if got != expected]
+        for name, got, expected in failed:
+            print(f"❌ Retrying {name}: expected (calls, result) {expected}, got {got}")
+        if failed:
+            return False
+        
+        print("✅ Transient errors retried up to max_retries times, other errors raised immediately")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Retry test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_checkpoint_skipping():
+    """Test that a resumed batch skips only resumes a previous run assessed for the same job profile."""
+    print("\nTesting batch checkpoint loading...")
+    
+    try:
+        matcher = new_matcher()
+        records = [
+            {"resume_path": "assessed.pdf", "success": True, "job_profile_path": "job.txt",
+             "llm_assessment": {"overall_score": 8}},
+            {"resume_path": "failed.pdf", "success": False, "job_profile_path": "job.txt",
+             "llm_assessment": None, "error": "Timed out"},
+            {"resume_path": "other_job.pdf", "success": True, "job_profile_path": "other_job.txt",
+             "llm_assessment": {"overall_score": 6}},
+            {"resume_path": "filtered.pdf", "success": True, "job_profile_path": "job.txt",
+             "llm_assessment": {"overall_score": None, "embedding_similarity": 0.12}},
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_path = Path(temp_dir) / "results.jsonl"
+            with open(results_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+                f.write('{"resume_path": "cut_short.pdf", "succ')  # A record cut short by a crash
+            
+            completed = matcher._load_completed_results(results_path, "job.txt")
+            missing = matcher._load_completed_results(Path(temp_dir) / "missing.jsonl", "job.txt")
+        
+        if sorted(completed) != ["assessed.pdf"]:
+            print(f"❌ Expected only assessed.pdf to be skipped, got {sorted(completed)}")
+            return False
+        if missing:
+            print(f"❌ Expected no completed resumes without a results file, got {sorted(missing)}")
+            return False
+        
+        print("✅ Only successful, LLM assessed resumes for the same job profile are skipped")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Checkpoint loading test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def run_all_tests():
+    """Run all tests and provide a summary."""
+    print("Resume Job Matcher - Test Suite")
+    print("=" * 50)
+    
+    tests = [
+        test_sdk_retries_disabled,
+        test_rate_limited_endpoint_failover,
+        test_retry_counts,
+        test_checkpoint_skipping,
+    ]
+    tests_passed = sum(1 for test in tests if test())
+    
+    print("\n" + "=" * 50)
+    print(f"Test Results: {tests_passed}/{len(tests)} tests passed")
+    
+    if tests_passed == len(tests):
+        print("🎉 All tests passed!")
+    else:
+        print("❌ Some tests failed. Please check the error messages above.")
+    return tests_passed == len(tests)
+
+
+def main():
+    """Main function."""
+    sys.exit(0 if run_all_tests() else 1)
+
+
+if __name__ == "__main__":
+    main()
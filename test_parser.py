@@ -20,13 +20,6 @@ def test_imports():
         print(f"❌ pandas import failed: {e}")
         return False
     
-    try:
-        import pdfplumber
-        print("✅ pdfplumber imported successfully")
-    except ImportError as e:
-        print(f"❌ pdfplumber import failed: {e}")
-        return False
-    
     try:
         import fitz  # PyMuPDF
         print("✅ PyMuPDF (fitz) imported successfully")
@@ -35,7 +28,6 @@ def test_imports():
         return False
     
     try:
-        from langchain.document_loaders import PyPDFLoader
         from langchain.text_splitter import RecursiveCharacterTextSplitter
         from langchain.schema import Document
         print("✅ LangChain components imported successfully")
@@ -70,6 +62,75 @@ def test_parser_initialization():
         return False
 
 
+def test_merge_small_chunks():
+    """Test that short chunks are merged into the preceding chunk of their page only within the size limits."""
+    print("\nTesting small chunk merging...")
+    
+    try:
+        from langchain.schema import Document
+        from resume_parser import CHARS_PER_TOKEN, MAX_CHUNK_TOKENS, MIN_CHUNK_TOKENS, ResumeParser
+        
+        parser = ResumeParser()
+        parser._encoding = None  # Count CHARS_PER_TOKEN characters per token, whatever tokenizer is installed
+        
+        def page(page_num, tokens):
+            text = "".join(chr(ord("a") + i % 26) for i in range(tokens * CHARS_PER_TOKEN))
+            return Document(page_content=text, metadata={'page': page_num})
+        
+        def chunk(pages, page_num, start_tokens, tokens):
+            start = start_tokens * CHARS_PER_TOKEN
+            content = pages[page_num].page_content[start:start + tokens * CHARS_PER_TOKEN]
+            return Document(page_content=content, metadata={'page': page_num, 'start_index': start})
+        
+        def merged_sizes(pages, chunks):
+            merged = parser._merge_small_chunks(chunks, pages)
+            return [(doc.metadata['page'], parser._count_tokens(doc.page_content)) for doc in merged]
+        
+        checks = []
+        
+        # A chunk just under the minimum is merged, the merge reaching exactly the maximum
+        pages = [page(0, MAX_CHUNK_TOKENS)]
+        previous_tokens = MAX_CHUNK_TOKENS - MIN_CHUNK_TOKENS + 1
+        chunks = [chunk(pages, 0, 0, previous_tokens), chunk(pages, 0, previous_tokens, MIN_CHUNK_TOKENS - 1)]
+        checks.append(("chunk under the minimum", merged_sizes(pages, chunks), [(0, MAX_CHUNK_TOKENS)]))
+        
+        # A chunk of exactly the minimum is kept
+        pages = [page(0, 300 + MIN_CHUNK_TOKENS)]
+        chunks = [chunk(pages, 0, 0, 300), chunk(pages, 0, 300, MIN_CHUNK_TOKENS)]
+        checks.append(("chunk of the minimum", merged_sizes(pages, chunks), [(0, 300), (0, MIN_CHUNK_TOKENS)]))
+        
+        # A merge that would exceed the maximum is not made
+        pages = [page(0, MAX_CHUNK_TOKENS + 1)]
+        chunks = [chunk(pages, 0, 0, previous_tokens + 1), chunk(pages, 0, previous_tokens + 1, MIN_CHUNK_TOKENS - 1)]
+        checks.append(("merge over the maximum", merged_sizes(pages, chunks),
+                       [(0, previous_tokens + 1), (0, MIN_CHUNK_TOKENS - 1)]))
+        
+        # A short chunk is never merged into the previous page's chunk
+        pages = [page(0, 300), page(1, MIN_CHUNK_TOKENS - 1)]
+        chunks = [chunk(pages, 0, 0, 300), chunk(pages, 1, 0, MIN_CHUNK_TOKENS - 1)]
+        checks.append(("short chunk on the next page", merged_sizes(pages, chunks), [(0, 300), (1, MIN_CHUNK_TOKENS - 1)]))
+        
+        # Overlapping chunks are merged without repeating the overlap
+        pages = [page(0, 350)]
+        chunks = [chunk(pages, 0, 0, 300), chunk(pages, 0, 250, 100 - 1)]
+        merged = parser._merge_small_chunks(chunks, pages)
+        checks.append(("overlapping chunks", [doc.page_content for doc in merged], [pages[0].page_content[:349 * CHARS_PER_TOKEN]]))
+        
+        failed = [(name, got, expected) for name, got, expected in checks if got != expected]
+        for name, got, expected in failed:
+            print(f"❌ Merging {name}: expected {expected}, got {got}")
+        if failed:
+            return False
+        
+        print("✅ Small chunks merged only within their page and the chunk size limits")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Chunk merging test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
 def create_sample_pdf():
     """Create a simple sample PDF for testing if reportlab is available."""
     try:
@@ -162,7 +223,12 @@ def run_all_tests():
     if test_parser_initialization():
         tests_passed += 1
     
-    # Test 3: Sample PDF creation and parsing
+    # Test 3: Small chunk merging
+    total_tests += 1
+    if test_merge_small_chunks():
+        tests_passed += 1
+    
+    # Test 4: Sample PDF creation and parsing
     total_tests += 1
     sample_pdf = create_sample_pdf()
     if sample_pdf and test_with_sample_pdf(sample_pdf):